@@ -0,0 +1,8 @@
+"""
+Offline benchmarks for JobSpy, run from the repository root, e.g.
+
+    python -m benchmarks.parsers --jobs 1000
+
+They use the synthetic fixtures in benchmarks.fixtures, which mirror the shape of
+each site's responses, so no network access is needed.
+"""
@@ -0,0 +1,137 @@
+"""
+Equivalence and throughput of the description converter backends:
+
+    python -m benchmarks.converters --jobs 500
+
+Converts a corpus of handcrafted HTML edge cases and fixture descriptions
+(as sent and prettified, as the LinkedIn and BDJobs parsers pass them) with
+the markdownify and lxml backends of jobspy.util, reports any description the
+two convert differently, then microseconds per description of each.
+Malformed HTML that the two parsers repair differently (an unclosed <p>
+before another block) is left out, see jobspy.converters.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from benchmarks import fixtures
+from jobspy.model import DescriptionFormat
+from jobspy.util import converter_backends
+
+CASES = [
+    "",
+    "   \n ",
+    "Just text",
+    "  leading and trailing  ",
+    "<p>one</p><p>two</p>",
+    "<div>\n  <p>\n    spaced   out\n  </p>\n</div>",
+    "<p>a <b>bold</b> <strong> strong </strong> <i>it</i><em></em></p>",
+    "<p>under_score and 2*3*4 [brackets] #hash</p>",
+    '<p><a href="https://example.com">https://example.com</a></p>',
+    '<p><a href="https://example.com" title="Say &quot;hi&quot;">site</a></p>',
+    "<p><a>no href</a> <a href=''>empty</a></p>",
+    "<h1>Title</h1><h2>Sub</h2><h3>Third  <i>level</i></h3><h6>six</h6><h7>x</h7>",
+    "<ul><li>one</li><li>two<ul><li>nested</li><li>more<ul><li>deep</li></ul>"
+    "</li></ul></li></ul><p>after</p>",
+    '<ol start="3"><li>three</li><li>four</li></ol><ol><li>one</li></ol>',
+    "<ul><li><p>para in li</p><p>second</p></li><li></li></ul>",
+    "<ul>\n<li>\nspaced\n</li>\n</ul>\ntext after",
+    "line one<br>line two<br/><br>line four",
+    "<blockquote><p>quoted</p><p>twice</p></blockquote>",
+    "<pre>  code\n    indented\n</pre><p>x</p>",
+    "<p><code>x = 1</code> and <code>`tick`</code> <kbd>Ctrl</kbd></p>",
+    "<pre><code>a_b *c*</code></pre>",
+    "<p>H<sub>2</sub>O and x<sup>2</sup> <del>old</del> <s>gone</s> "
+    "<q>quote</q></p>",
+    "<hr><p>below rule</p>",
+    '<p><img src="a.png" alt="Logo" title="T"> <img src="b.png"></p>',
+    '<video src="v.mp4" poster="p.png">clip</video>',
+    "<dl><dt>Term</dt><dd>Definition\nmore</dd></dl>",
+    "<table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>",
+    "<table><thead><tr><td>A</td></tr></thead><tbody><tr><td>1</td></tr>"
+    "</tbody></table>",
+    '<table><tr><td colspan="2">wide</td></tr><tr><td>a</td><td>b</td></tr></table>',
+    "<table><caption>Cap</caption><tr><td><p>in</p><br>cell</td></tr></table>",
+    "<figure><img src='f.png'><figcaption>Fig</figcaption></figure>",
+    "<p>a</p><script>var x = 1;</script><style>p {}</style><!-- note -->b",
+    "<p>&amp; &lt;tag&gt; &nbsp; &copy; caf&eacute;</p>",
+    "<span>inline</span> <span>spans</span>\n\n\n<div>block</div>",
+    "<p>a<!--c--> b</p><div>x<span> </span>y <!-- c --> </div>",
+    "<ul><li>a</li><!-- c --> <li>b</li></ul> <ol><li>c</li></ol>\n<p>d</p>",
+    "<div>  <em> padded </em>  <code> spaced </code> </div>",
+    "<section><article><h4>Head</h4>body</article></section>",
+    "<div><b>Requirements:</b><br>- one<br>- two</div>",
+    "<p>tabs\tand\r\nnewlines</p>",
+    "<p>intro</p>" + "<div>" * 300 + "deep" + "</div>" * 300 + "<p>after</p>",
+]
+
+
+def corpus(rng: random.Random, n: int) -> list[str]:
+    descriptions = list(CASES)
+    for _ in range(n):
+        html = fixtures.description_html(rng)
+        descriptions.append(html)
+        descriptions.append(BeautifulSoup(html, "html.parser").prettify())
+    return descriptions
+
+
+def mismatches(
+    descriptions: list[str], description_format: DescriptionFormat
+) -> list[tuple[str, str, str]]:
+    expected = converter_backends["markdownify"][description_format]
+    actual = converter_backends["lxml"][description_format]
+    found = []
+    for html in descriptions:
+        want, got = expected(html), actual(html)
+        if want != got:
+            found.append((html, want, got))
+    return found
+
+
+def per_description(
+    convert: Callable[[str], str], descriptions: list[str], repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for html in descriptions:
+            convert(html)
+        best = min(best, time.perf_counter() - start)
+    return 1e6 * best / len(descriptions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    descriptions = corpus(random.Random(0), args.jobs)
+    formats = [DescriptionFormat.MARKDOWN, DescriptionFormat.PLAIN]
+    failed = False
+    for description_format in formats:
+        for html, want, got in mismatches(descriptions, description_format):
+            failed = True
+            print(f"{description_format.value} mismatch for {html!r}")
+            print(f"  markdownify: {want!r}")
+            print(f"  lxml:        {got!r}")
+
+    timed = descriptions[len(CASES) :]
+    print(f"{'benchmark':<24}{'us/description':>16}")
+    for description_format in formats:
+        for backend, converters in converter_backends.items():
+            micros = per_description(converters[description_format], timed, args.repeat)
+            print(f"{description_format.value + ' ' + backend:<24}{micros:>16.1f}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
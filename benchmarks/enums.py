@@ -0,0 +1,130 @@
+"""
+Cost of the JobType and Country lookups the parsers make for each job:
+
+    python -m benchmarks.enums
+
+Reports microseconds per call of get_enum_from_job_type, get_enum_from_value
+and Country.from_string next to the loops over the enums they replaced, and
+per job of the lookups of Indeed's get_job_type and LinkedIn's _get_location.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from jobspy.indeed.util import get_job_type
+from jobspy.model import Country, JobType
+from jobspy.util import get_enum_from_job_type, get_enum_from_value
+
+
+def loop_job_type(job_type_str: str) -> JobType | None:
+    """
+    Reference get_enum_from_job_type looping over every JobType
+    """
+    res = None
+    for job_type in JobType:
+        if job_type_str in job_type.value:
+            res = job_type
+    return res
+
+
+def loop_value(value_str: str) -> JobType:
+    """
+    Reference get_enum_from_value looping over every JobType
+    """
+    for job_type in JobType:
+        if value_str in job_type.value:
+            return job_type
+    raise Exception(f"Invalid job type: {value_str}")
+
+
+def loop_country(country_str: str) -> Country:
+    """
+    Reference Country.from_string splitting the names of every country
+    """
+    country_str = country_str.strip().lower()
+    for country in Country:
+        if country_str in country.value[0].split(","):
+            return country
+    raise ValueError(f"Invalid country string: '{country_str}'")
+
+
+def per_call(run: Callable[[str], object], args: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for arg in args:
+            run(arg)
+        best = min(best, time.perf_counter() - start)
+    return 1e6 * best / len(args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    job_type_values = [value for job_type in JobType for value in job_type.value]
+    job_types = [rng.choice(job_type_values + ["seasonal"]) for _ in range(args.calls)]
+    values = [rng.choice(job_type_values) for _ in range(args.calls)]
+    country_names = [name for c in Country for name in c.value[0].split(",")]
+    countries = [rng.choice(country_names).title() for _ in range(args.calls)]
+    for job_type_str, value, country in zip(job_types, values, countries):
+        assert loop_job_type(job_type_str) == get_enum_from_job_type(job_type_str)
+        assert loop_value(value) == get_enum_from_value(value)
+        assert loop_country(country) == Country.from_string(country)
+
+    # Indeed jobs carry a few attribute labels, LinkedIn locations resolve the
+    # scraper's country and often the one in the location string
+    attributes = [{"label": label} for label in ("Full-time", "Remote", "Health")]
+    jobs = [None] * (args.calls // 10)
+
+    def linkedin_countries(_):
+        Country.from_string("usa")
+        Country.from_string("United States")
+
+    def loop_linkedin_countries(_):
+        loop_country("usa")
+        loop_country("United States")
+
+    results = {
+        "get_enum_from_job_type": (
+            per_call(loop_job_type, job_types, args.repeat),
+            per_call(get_enum_from_job_type, job_types, args.repeat),
+        ),
+        "get_enum_from_value": (
+            per_call(loop_value, values, args.repeat),
+            per_call(get_enum_from_value, values, args.repeat),
+        ),
+        "Country.from_string": (
+            per_call(loop_country, countries, args.repeat),
+            per_call(Country.from_string, countries, args.repeat),
+        ),
+        "indeed get_job_type / job": (
+            per_call(
+                lambda _: [
+                    loop_job_type(a["label"].replace("-", "").replace(" ", "").lower())
+                    for a in attributes
+                ],
+                jobs,
+                args.repeat,
+            ),
+            per_call(lambda _: get_job_type(attributes), jobs, args.repeat),
+        ),
+        "linkedin countries / job": (
+            per_call(loop_linkedin_countries, jobs, args.repeat),
+            per_call(linkedin_countries, jobs, args.repeat),
+        ),
+    }
+    print(f"{'benchmark':<28}{'loop us':>10}{'dict us':>10}")
+    for name, (loop_micros, dict_micros) in results.items():
+        print(f"{name:<28}{loop_micros:>10.3f}{dict_micros:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Synthetic, deterministic fixtures shaped like the responses each scraper parses,
+and a transport that serves the job detail requests the parsers make
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+from typing import Callable
+from urllib.parse import quote
+
+import requests
+
+from jobspy.util import build_response
+
+WORDS = (
+    "build scalable reliable services team product customers data platform design "
+    "ship features mentor engineers review code python cloud remote hybrid "
+    "experience years strong communication ownership collaborate testing "
+    "deploy monitor improve performance security api distributed systems"
+).split()
+TITLES = [
+    "Software Engineer",
+    "Senior Data Engineer",
+    "Backend Developer",
+    "Machine Learning Engineer",
+    "Product Manager",
+    "DevOps Engineer",
+    "Frontend Developer",
+    "QA Analyst",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+CITIES = [
+    ("Austin", "TX"),
+    ("Seattle", "WA"),
+    ("New York", "NY"),
+    ("Denver", "CO"),
+    ("Chicago", "IL"),
+]
+
+
+def sentence(rng: random.Random, words: int = 14) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def description_html(rng: random.Random) -> str:
+    """A job description of ~3 KB of HTML with paragraphs, lists and links"""
+    parts = ["<div><h2>About the role</h2>"]
+    parts += [f"<p>{sentence(rng, 30)}</p>" for _ in range(3)]
+    parts.append("<h3>Responsibilities</h3><ul>")
+    parts += [f"<li>{sentence(rng)}</li>" for _ in range(8)]
+    parts.append("</ul><h3>Requirements</h3><ul>")
+    parts += [
+        f"<li><b>{rng.choice(WORDS)}</b> {sentence(rng, 10)}</li>" for _ in range(6)
+    ]
+    parts.append(
+        "</ul><p>Salary: $120,000 - $150,000 per year. Apply at "
+        '<a href="https://careers.example.com">careers.example.com</a> or email '
+        "jobs@example.com.</p></div>"
+    )
+    return "".join(parts)
+
+
+class FixtureTransport:
+    """
+    Stands in for a replayed jobspy.replay.HttpArchive: installed with
+    jobspy.util.set_http_archive, it answers the sessions' requests from
+    handlers matched by method and url regex, so nothing reaches the network
+    """
+
+    replaying = True
+
+    def __init__(self):
+        self.routes: list[tuple[str, re.Pattern, Callable[[str, dict], str]]] = []
+
+    def route(self, method: str, pattern: str, handler: Callable[[str, dict], str]):
+        self.routes.append((method, re.compile(pattern), handler))
+
+    def replay(self, method: str, url: str, kwargs: dict) -> requests.Response:
+        for route_method, pattern, handler in self.routes:
+            if route_method == method.upper() and pattern.search(url):
+                content = handler(url, kwargs).encode()
+                headers = {"Content-Type": "text/html; charset=utf-8"}
+                return build_response(200, url, headers, content)
+        raise requests.exceptions.ConnectionError(f"No fixture for {method} {url}")
+
+
+def linkedin_search_page(rng: random.Random, n: int) -> str:
+    cards = []
+    for i in range(n):
+        city, state = rng.choice(CITIES)
+        job_id = 3_900_000_000 + i
+        cards.append(
+            f'<div class="base-card base-search-card job-search-card">'
+            f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/'
+            f'software-engineer-at-acme-{job_id}?refId=abc&trackingId=def">'
+            f'<span class="sr-only">{rng.choice(TITLES)}</span></a>'
+            f'<div class="base-search-card__info">'
+            f'<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" '
+            f'href="https://www.linkedin.com/company/{rng.choice(COMPANIES).lower()}'
+            f'?trk=public_jobs">{rng.choice(COMPANIES)}</a></h4>'
+            f'<div class="base-search-card__metadata">'
+            f'<span class="job-search-card__location">{city}, {state}</span>'
+            f'<span class="job-search-card__salary-info">$120,000.00 - $150,000.00'
+            f"</span>"
+            f'<time class="job-search-card__listdate" datetime="2025-01-15">'
+            f"1 week ago</time></div></div></div>"
+        )
+    return f"<ul>{''.join(cards)}</ul>"
+
+
+def linkedin_job_page(rng: random.Random) -> str:
+    criteria = [
+        ("Seniority level", "Mid-Senior level"),
+        ("Employment type", "Full-time"),
+        ("Job function", "Engineering"),
+        ("Industries", "Software Development"),
+    ]
+    criteria_html = "".join(
+        f'<li class="description__job-criteria-item">'
+        f'<h3 class="description__job-criteria-subheader">{name}</h3>'
+        f'<span class="description__job-criteria-text '
+        f'description__job-criteria-text--criteria">{value}</span></li>'
+        for name, value in criteria
+    )
+    apply_url = quote("https://careers.example.com/jobs/1?src=li", safe="")
+    return (
+        f"<html><body>"
+        f'<img class="artdeco-entity-image" '
+        f'data-delayed-url="https://media.licdn.com/logo.png">'
+        f'<code id="applyUrl"><!--"https://www.linkedin.com/jobs/view/externalApply/1'
+        f'?url={apply_url}&urlHash=x"--></code>'
+        f'<div class="show-more-less-html__markup relative">'
+        f"{description_html(rng)}</div>"
+        f'<ul class="description__job-criteria-list">{criteria_html}</ul>'
+        f"</body></html>"
+    )
+
+
+def indeed_jobs(rng: random.Random, n: int) -> list[dict]:
+    jobs = []
+    for i in range(n):
+        city, state = rng.choice(CITIES)
+        company = rng.choice(COMPANIES)
+        jobs.append(
+            {
+                "key": f"{i:016x}",
+                "title": rng.choice(TITLES),
+                "datePublished": 1736900000000 + i * 1000,
+                "description": {"html": description_html(rng)},
+                "location": {
+                    "countryCode": "US",
+                    "admin1Code": state,
+                    "city": city,
+                    "formatted": {"short": city, "long": f"{city}, {state}"},
+                },
+                "compensation": {
+                    "baseSalary": {
+                        "unitOfWork": "YEAR",
+                        "range": {"min": 120000, "max": 150000},
+                    },
+                    "estimated": None,
+                    "currencyCode": "USD",
+                },
+                "attributes": [
+                    {"key": "CF3CP", "label": "Full-time"},
+                    {"key": "DSQF7", "label": "Remote"},
+                ],
+                "employer": {
+                    "relativeCompanyPageUrl": f"/cmp/{company}",
+                    "name": company,
+                    "dossier": {
+                        "employerDetails": {
+                            "addresses": ["1 Main St, Austin, TX"],
+                            "industry": "Technology_Iv1",
+                            "employeesLocalizedLabel": "1,001 to 5,000",
+                            "revenueLocalizedLabel": "$100M to $500M",
+                            "briefDescription": sentence(rng, 20),
+                        },
+                        "images": {"squareLogoUrl": "https://example.com/logo.png"},
+                        "links": {"corporateWebsite": "https://example.com"},
+                    },
+                },
+                "recruit": {"viewJobUrl": f"https://example.com/apply/{i}"},
+            }
+        )
+    return jobs
+
+
+def glassdoor_jobs(rng: random.Random, n: int) -> list[dict]:
+    jobs = []
+    for i in range(n):
+        city, state = rng.choice(CITIES)
+        jobs.append(
+            {
+                "jobview": {
+                    "job": {
+                        "listingId": 1_009_000_000 + i,
+                        "jobTitleText": rng.choice(TITLES),
+                    },
+                    "header": {
+                        "employerNameFromSearch": rng.choice(COMPANIES),
+                        "employer": {"id": 1000 + i % 50},
+                        "locationName": f"{city}, {state}",
+                        "locationType": "C",
+                        "ageInDays": i % 30,
+                        "payPeriod": "ANNUAL",
+                        "payPeriodAdjustedPay": {"p10": 120000.0, "p90": 150000.0},
+                        "payCurrency": "USD",
+                        "adOrderSponsorshipLevel": "STANDARD",
+                    },
+                    "overview": {"squareLogoUrl": "https://example.com/logo.png"},
+                }
+            }
+        )
+    return jobs
+
+
+def glassdoor_description(rng: random.Random) -> str:
+    description = {"description": description_html(rng), "__typename": "JobDetails"}
+    return json.dumps([{"data": {"jobview": {"job": description}}}])
+
+
+def google_page(rng: random.Random, n: int, offset: int = 0) -> str:
+    entries = []
+    for i in range(n):
+        city, state = rng.choice(CITIES)
+        job_info = [None] * 30
+        job_info[0] = rng.choice(TITLES)
+        job_info[1] = rng.choice(COMPANIES)
+        job_info[2] = f"{city}, {state}, United States"
+        job_info[3] = [[f"https://careers.example.com/jobs/{offset + i}"]]
+        job_info[12] = f"{1 + i % 20} days ago"
+        job_info[19] = " ".join(sentence(rng, 25) for _ in range(12))
+        job_info[28] = f"go{offset + i:012d}"
+        entries.append(["0", json.dumps([[[{"520084652": job_info}]]])])
+    return f'<div data-async-fc="cursor{offset}"></div>' + json.dumps([entries])
+
+
+def ziprecruiter_jobs(rng: random.Random, n: int) -> list[dict]:
+    jobs = []
+    for i in range(n):
+        city, state = rng.choice(CITIES)
+        jobs.append(
+            {
+                "name": rng.choice(TITLES),
+                "listing_key": f"zr{i:010d}",
+                "job_description": sentence(rng, 40),
+                "buyer_type": "organic",
+                "hiring_company": {"name": rng.choice(COMPANIES)},
+                "job_country": "US",
+                "job_city": city,
+                "job_state": state,
+                "employment_type": "full_time",
+                "posted_time": "2025-01-15T10:00:00Z",
+                "compensation_interval": "annual",
+                "compensation_min": 120000,
+                "compensation_max": 150000,
+                "compensation_currency": "USD",
+            }
+        )
+    return jobs
+
+
+def ziprecruiter_job_page(rng: random.Random) -> str:
+    model = {"model": {"saveJobURL": "/save?job_url=https://careers.example.com/1"}}
+    return (
+        f'<html><body><div class="job_description">{description_html(rng)}</div>'
+        f'<section class="company_description"><p>{sentence(rng, 40)}</p></section>'
+        f'<script type="application/json">{json.dumps(model)}</script></body></html>'
+    )
+
+
+def naukri_jobs(rng: random.Random, n: int) -> list[dict]:
+    jobs = []
+    for i in range(n):
+        jobs.append(
+            {
+                "jobId": f"{100000 + i}",
+                "title": rng.choice(TITLES),
+                "companyName": rng.choice(COMPANIES),
+                "staticUrl": "acme-jobs-careers-123",
+                "jdURL": f"/job-listings-software-engineer-{100000 + i}",
+                "placeholders": [
+                    {"type": "experience", "label": "3-5 Yrs"},
+                    {"type": "salary", "label": "12-16 Lacs P.A."},
+                    {"type": "location", "label": "Bengaluru, Karnataka"},
+                ],
+                "footerPlaceholderLabel": f"{1 + i % 20} Days Ago",
+                "createdDate": 1736900000000,
+                "jobDescription": description_html(rng)
+                + '<span class="job-type">Full-time</span>'
+                + '<span class="industry">IT Services</span>',
+                "logoPathV3": "https://img.naukimg.com/logo.gif",
+                "tagsAndSkills": "python,django,aws,sql",
+                "experienceText": "3-5 Yrs",
+                "ambitionBoxData": {"AggregateRating": "4.1", "ReviewsCount": 120},
+                "vacancy": 2,
+            }
+        )
+    return jobs
+
+
+def bdjobs_search_page(rng: random.Random, n: int) -> str:
+    cards = []
+    for i in range(n):
+        cards.append(
+            f'<div class="norm-jobs-wrapper"><div class="job-title-text">'
+            f'<a href="jobdetails.asp?id={1_300_000 + i}&fcatId=8&ln=1">'
+            f"{rng.choice(TITLES)}</a></div>"
+            f'<div class="comp-name-text">{rng.choice(COMPANIES)} Ltd.</div>'
+            f'<div class="locon-text-d">Dhaka</div>'
+            f'<div class="deadline-text-d">Deadline: 15 Jan 2025</div></div>'
+        )
+    return f"<div>{''.join(cards)}</div>"
+
+
+def bdjobs_job_page(rng: random.Random) -> str:
+    responsibilities = "".join(f"<li>{sentence(rng)}</li>" for _ in range(10))
+    return (
+        f'<html><body><div class="jobcontent"><h4 id="job_resp">Responsibilities'
+        f"</h4><ul>{responsibilities}</ul><hr></div>"
+        f"<div><span>Employment Status</span><span>Full Time</span></div>"
+        f"<div><span>Industry</span><span>IT Enabled Service</span></div>"
+        f"</body></html>"
+    )
+
+
+def bayt_search_page(rng: random.Random, n: int) -> str:
+    items = []
+    for i in range(n):
+        items.append(
+            f'<li data-js-job="" class="has-pointer-d"><h2 class="jb-title">'
+            f'<a href="/en/uae/jobs/software-engineer-{5_000_000 + i}/">'
+            f"{rng.choice(TITLES)}</a></h2>"
+            f'<div class="t-nowrap p10l"><span>{rng.choice(COMPANIES)}</span></div>'
+            f'<div class="t-mute t-small">Dubai, UAE</div></li>'
+        )
+    return f"<ul>{''.join(items)}</ul>"
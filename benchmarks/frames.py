@@ -0,0 +1,95 @@
+"""
+Cost of assembling the scrape_jobs DataFrame from job rows:
+
+    python -m benchmarks.frames --jobs 5000
+
+Reports rows per second of the per-job frames scrape_jobs built (one
+pd.DataFrame([row]) per job, dropna on each, then concat) next to
+JobFrameBuilder's column buffers, after checking both give the same frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable
+
+import pandas as pd
+
+from benchmarks.models import job_kwargs
+from jobspy import _job_to_row
+from jobspy.model import Country, JobPost
+from jobspy.util import JobFrameBuilder, desired_order
+
+
+def per_job_frames(rows: list[dict]) -> pd.DataFrame:
+    """
+    Reference frame assembly building and concatenating a DataFrame per job, as
+    scrape_jobs did before JobFrameBuilder
+    """
+    jobs_dfs = [pd.DataFrame([row]) for row in rows]
+    filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def column_buffers(rows: list[dict]) -> pd.DataFrame:
+    builder = JobFrameBuilder()
+    builder.extend(rows)
+    return builder.build()
+
+
+def rows_per_second(
+    build: Callable[[list[dict]], pd.DataFrame], rows: list[dict], repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    sites = ["indeed", "linkedin", "zip_recruiter"]
+    rows = []
+    for i in range(args.jobs):
+        job = JobPost(**job_kwargs(rng, i))
+        if i % 3:
+            # rows without a salary or emails, for columns empty in some frames
+            job.compensation = job.emails = None
+        rows.append(_job_to_row(job, sites[i % 3], Country.USA, False))
+
+    expected = per_job_frames(rows).astype(object).where(lambda df: df.notna())
+    actual = column_buffers(rows).astype(object).where(lambda df: df.notna())
+    failed = not expected.equals(actual)
+    if failed:
+        print("per-job frames and JobFrameBuilder built different frames")
+
+    results = {
+        "per-job frames": rows_per_second(per_job_frames, rows, args.repeat),
+        "JobFrameBuilder": rows_per_second(column_buffers, rows, args.repeat),
+    }
+    print(f"{'benchmark':<20}{'rows/s':>12}")
+    for name, speed in results.items():
+        print(f"{name:<20}{speed:>12,.0f}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
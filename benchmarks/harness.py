@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass
+class Measurement:
+    name: str
+    jobs: int
+    seconds: float
+    peak_bytes: int
+    allocated_blocks: int
+
+    @property
+    def jobs_per_sec(self) -> float:
+        return self.jobs / self.seconds if self.seconds else float("inf")
+
+
+def measure(
+    name: str, setup: Callable[[], Callable[[], int]], repeat: int = 3
+) -> Measurement:
+    """
+    Times the run returned by setup(), which returns the number of jobs it
+    processed. Speed is the best of `repeat` untraced runs; peak memory and the
+    memory blocks still allocated afterwards come from one more run under
+    tracemalloc. setup() is called before every run and is not timed
+    """
+    best = float("inf")
+    jobs = 0
+    for _ in range(repeat):
+        run = setup()
+        gc.collect()
+        start = time.perf_counter()
+        jobs = run()
+        best = min(best, time.perf_counter() - start)
+
+    run = setup()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    del result
+    return Measurement(name, jobs, best, peak - base, blocks)
+
+
+def report(measurements: list[Measurement]):
+    print(
+        f"{'benchmark':<24}{'jobs':>8}{'jobs/sec':>12}{'ms/job':>10}"
+        f"{'peak MiB':>10}{'blocks/job':>12}"
+    )
+    for m in measurements:
+        print(
+            f"{m.name:<24}{m.jobs:>8}{m.jobs_per_sec:>12.1f}"
+            f"{1000 * m.seconds / max(m.jobs, 1):>10.3f}"
+            f"{m.peak_bytes / 2**20:>10.2f}"
+            f"{m.allocated_blocks / max(m.jobs, 1):>12.1f}"
+        )
@@ -0,0 +1,109 @@
+"""
+Cost per job of building JobPost models and flattening them into rows:
+
+    python -m benchmarks.models --jobs 20000
+
+Reports microseconds per job of validated JobPost construction next to
+JobPost.model_construct (no validation), and of the row conversion of
+scrape_jobs next to the model_dump and Location revalidation it replaced.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import date
+from typing import Callable
+
+from benchmarks import fixtures
+from jobspy import _job_to_row
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+)
+
+
+def job_kwargs(rng: random.Random, i: int) -> dict:
+    city, state = rng.choice(fixtures.CITIES)
+    return dict(
+        id=f"in-{i}",
+        title=rng.choice(fixtures.TITLES),
+        company_name=rng.choice(fixtures.COMPANIES),
+        company_url="https://www.indeed.com/cmp/acme",
+        location=Location(city=city, state=state, country=Country.USA),
+        is_remote=False,
+        date_posted=date(2025, 1, 15),
+        job_url=f"https://www.indeed.com/viewjob?jk={i:016x}",
+        compensation=Compensation(
+            interval=CompensationInterval.YEARLY,
+            min_amount=120000.0,
+            max_amount=150000.0,
+            currency="USD",
+        ),
+        job_type=[JobType.FULL_TIME],
+        description=fixtures.sentence(rng, 400),
+        emails=["jobs@example.com"],
+        company_industry="Technology",
+        company_logo="https://example.com/logo.png",
+    )
+
+
+def model_dump_row(job: JobPost) -> dict:
+    """
+    Reference row conversion dumping the model to a dict and revalidating its
+    location, as scrape_jobs did before reading attributes directly
+    """
+    job_data = job.model_dump()
+    job_data["company"] = job_data["company_name"]
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+    return job_data
+
+
+def per_job(run: Callable[[], object], n: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return 1e6 * best / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    n = args.jobs
+
+    rng = random.Random(0)
+    kwargs = [job_kwargs(rng, i) for i in range(n)]
+    jobs = [JobPost(**job) for job in kwargs]
+    results = {
+        "JobPost(**kwargs)": per_job(
+            lambda: [JobPost(**job) for job in kwargs], n, args.repeat
+        ),
+        "JobPost.model_construct": per_job(
+            lambda: [JobPost.model_construct(**job) for job in kwargs], n, args.repeat
+        ),
+        "model_dump row": per_job(
+            lambda: [model_dump_row(job) for job in jobs], n, args.repeat
+        ),
+        "_job_to_row": per_job(
+            lambda: [_job_to_row(job, "indeed", Country.USA, False) for job in jobs],
+            n,
+            args.repeat,
+        ),
+    }
+    print(f"{'benchmark':<26}{'us/job':>10}")
+    for name, micros in results.items():
+        print(f"{name:<26}{micros:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
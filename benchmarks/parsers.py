@@ -0,0 +1,268 @@
+"""
+Throughput of each site's job parser over synthetic fixtures:
+
+    python -m benchmarks.parsers --jobs 500 --repeat 3 --sites linkedin indeed
+
+Search results are parsed into cards or dicts up front, so the timings cover the
+per-job parser alone, including the detail page fetch (answered by a
+FixtureTransport) and its HTML parsing and description conversion.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from benchmarks import fixtures
+from benchmarks.harness import Measurement, measure, report
+from jobspy import util
+from jobspy.bayt import BaytScraper
+from jobspy.bdjobs import BDJobs
+from jobspy.glassdoor import Glassdoor
+from jobspy.google import Google
+from jobspy.indeed import Indeed
+from jobspy.linkedin import LinkedIn
+from jobspy.model import DescriptionFormat, ScraperInput, Site
+from jobspy.naukri import Naukri
+from jobspy.util import (
+    create_session,
+    set_conversion_cache,
+    set_http_archive,
+    set_logger_level,
+)
+from jobspy.ziprecruiter import ZipRecruiter
+
+
+def scraper_input(site: Site, description_format: DescriptionFormat) -> ScraperInput:
+    return ScraperInput(
+        site_type=[site],
+        search_term="software engineer",
+        description_format=description_format,
+        linkedin_fetch_description=True,
+    )
+
+
+def linkedin(rng, n, transport, description_format):
+    page = fixtures.linkedin_search_page(rng, n)
+    detail = fixtures.linkedin_job_page(rng)
+    transport.route("GET", r"linkedin\.com/jobs/view/\d+", lambda url, kw: detail)
+
+    def setup():
+        scraper = LinkedIn()
+        scraper.scraper_input = scraper_input(Site.LINKEDIN, description_format)
+        cards = BeautifulSoup(page, "html.parser").find_all(
+            "div", class_="base-search-card"
+        )
+
+        def run():
+            for card in cards:
+                href = card.find("a", class_="base-card__full-link")["href"]
+                job_id = href.split("?")[0].split("-")[-1]
+                scraper._process_job(card, job_id, True)
+            return len(cards)
+
+        return run
+
+    return setup
+
+
+def indeed(rng, n, transport, description_format):
+    jobs = fixtures.indeed_jobs(rng, n)
+
+    def setup():
+        scraper = Indeed()
+        scraper.scraper_input = scraper_input(Site.INDEED, description_format)
+        scraper.base_url = "https://www.indeed.com"
+
+        def run():
+            for job in jobs:
+                scraper._process_job(job)
+            return len(jobs)
+
+        return run
+
+    return setup
+
+
+def glassdoor(rng, n, transport, description_format):
+    jobs = fixtures.glassdoor_jobs(rng, n)
+    detail = fixtures.glassdoor_description(rng)
+    transport.route("POST", r"glassdoor\.com/+graph", lambda url, kw: detail)
+
+    def setup():
+        scraper = Glassdoor()
+        scraper.scraper_input = scraper_input(Site.GLASSDOOR, description_format)
+        scraper.base_url = "https://www.glassdoor.com/"
+        scraper.session = create_session(has_retry=True)
+
+        def run():
+            for job in jobs:
+                scraper._process_job(job)
+            return len(jobs)
+
+        return run
+
+    return setup
+
+
+def google(rng, n, transport, description_format):
+    pages = [fixtures.google_page(rng, 10, offset) for offset in range(0, n, 10)]
+
+    def setup():
+        scraper = Google()
+        scraper.scraper_input = scraper_input(Site.GOOGLE, description_format)
+
+        def run():
+            return sum(len(scraper._parse_jobs(page)[0]) for page in pages)
+
+        return run
+
+    return setup
+
+
+def zip_recruiter(rng, n, transport, description_format):
+    jobs = fixtures.ziprecruiter_jobs(rng, n)
+    detail = fixtures.ziprecruiter_job_page(rng)
+    transport.route("GET", r"ziprecruiter\.com/jobs//j\?lvk=", lambda url, kw: detail)
+    transport.route("POST", r"ziprecruiter\.com/jobs-app/event", lambda url, kw: "")
+
+    def setup():
+        scraper = ZipRecruiter()
+        scraper.scraper_input = scraper_input(Site.ZIP_RECRUITER, description_format)
+
+        def run():
+            for job in jobs:
+                scraper._process_job(job)
+            return len(jobs)
+
+        return run
+
+    return setup
+
+
+def naukri(rng, n, transport, description_format):
+    jobs = fixtures.naukri_jobs(rng, n)
+
+    def setup():
+        scraper = Naukri()
+        scraper.scraper_input = scraper_input(Site.NAUKRI, description_format)
+
+        def run():
+            for job in jobs:
+                scraper._process_job(job, job["jobId"], True)
+            return len(jobs)
+
+        return run
+
+    return setup
+
+
+def bdjobs(rng, n, transport, description_format):
+    page = fixtures.bdjobs_search_page(rng, n)
+    detail = fixtures.bdjobs_job_page(rng)
+    transport.route("GET", r"bdjobs\.com/.*jobdetail", lambda url, kw: detail)
+
+    def setup():
+        scraper = BDJobs()
+        scraper.scraper_input = scraper_input(Site.BDJOBS, description_format)
+        cards = BeautifulSoup(page, "html.parser").find_all(
+            "div", class_="norm-jobs-wrapper"
+        )
+
+        def run():
+            for card in cards:
+                scraper._process_job(card)
+            return len(cards)
+
+        return run
+
+    return setup
+
+
+def bayt(rng, n, transport, description_format):
+    page = fixtures.bayt_search_page(rng, n)
+
+    def setup():
+        scraper = BaytScraper()
+        items = BeautifulSoup(page, "html.parser").find_all(
+            "li", attrs={"data-js-job": True}
+        )
+
+        def run():
+            for item in items:
+                scraper._extract_job_info(item)
+            return len(items)
+
+        return run
+
+    return setup
+
+
+benchmarks: dict[str, Callable] = {
+    "linkedin": linkedin,
+    "indeed": indeed,
+    "glassdoor": glassdoor,
+    "google": google,
+    "zip_recruiter": zip_recruiter,
+    "naukri": naukri,
+    "bdjobs": bdjobs,
+    "bayt": bayt,
+}
+
+
+def run_benchmarks(
+    sites: list[str],
+    jobs: int = 500,
+    repeat: int = 3,
+    description_format: DescriptionFormat = DescriptionFormat.MARKDOWN,
+    seed: int = 0,
+) -> list[Measurement]:
+    set_logger_level(0)
+    transport = fixtures.FixtureTransport()
+    set_http_archive(transport)
+    # every round converts the same descriptions, which a conversion cache would
+    # serve from the second round on
+    conversion_cache = util.conversion_cache
+    set_conversion_cache(None)
+    try:
+        measurements = []
+        for site in sites:
+            rng = random.Random(seed)
+            setup = benchmarks[site](rng, jobs, transport, description_format)
+            measurements.append(measure(site, setup, repeat))
+        return measurements
+    finally:
+        set_http_archive(None)
+        set_conversion_cache(conversion_cache)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--format",
+        choices=[f.value for f in DescriptionFormat],
+        default=DescriptionFormat.MARKDOWN.value,
+    )
+    parser.add_argument(
+        "--sites", nargs="+", choices=list(benchmarks), default=list(benchmarks)
+    )
+    args = parser.parse_args()
+    report(
+        run_benchmarks(
+            args.sites,
+            jobs=args.jobs,
+            repeat=args.repeat,
+            description_format=DescriptionFormat(args.format),
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Cost of extracting salaries from job descriptions:
+
+    python -m benchmarks.salaries --jobs 100000
+
+Reports microseconds per description of extract_salary called on each one, as
+scrape_jobs did, next to extract_salaries over the whole column, with and
+without pyarrow.
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import random
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+import pandas as pd
+
+from benchmarks import fixtures
+from jobspy.util import extract_salaries, extract_salary
+
+
+def salary_text(rng: random.Random) -> str:
+    low = rng.randint(40, 150)
+    return rng.choice(
+        [
+            f"${low},000 - ${low + rng.randint(10, 60)},000 per year",
+            f"${low}k-{low + 20}k",
+            f"${low // 4}.50 - ${low // 3} an hour",
+            f"${low * 80:,} – ${low * 100:,} a month",
+        ]
+    )
+
+
+def description(rng: random.Random, words: int) -> str:
+    """
+    Description of about words words, a third of them with a salary range
+    """
+    text = fixtures.sentence(rng, words)
+    if rng.random() < 1 / 3:
+        cut = rng.randint(0, len(text))
+        text = f"{text[:cut]} {salary_text(rng)}. {text[cut:]}"
+    return text
+
+
+@contextmanager
+def without_pyarrow() -> Iterator[None]:
+    """
+    Makes pyarrow fail to import in the block, for the fallback of
+    extract_salaries
+    """
+    import_module = builtins.__import__
+
+    def guarded_import(name, *args, **kwargs):
+        if name.split(".")[0] == "pyarrow":
+            raise ImportError(name)
+        return import_module(name, *args, **kwargs)
+
+    builtins.__import__ = guarded_import
+    try:
+        yield
+    finally:
+        builtins.__import__ = import_module
+
+
+def per_job(run: Callable[[], object], n: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return 1e6 * best / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--jobs", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    n = args.jobs
+
+    rng = random.Random(0)
+    descriptions = pd.Series([description(rng, args.words) for _ in range(n)])
+
+    def without_arrow():
+        with without_pyarrow():
+            extract_salaries(descriptions)
+
+    results = {
+        "extract_salary per job": per_job(
+            lambda: [extract_salary(text) for text in descriptions], n, args.repeat
+        ),
+        "extract_salaries": per_job(
+            lambda: extract_salaries(descriptions), n, args.repeat
+        ),
+        "extract_salaries no arrow": per_job(without_arrow, n, args.repeat),
+    }
+    print(f"{'benchmark':<28}{'us/job':>10}")
+    for name, micros in results.items():
+        print(f"{name:<28}{micros:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
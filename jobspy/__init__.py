@@ -1,32 +1,70 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from typing import AsyncIterator, Callable, Container, Iterator
 
 import pandas as pd
 
 from jobspy.bayt import BaytScraper
 from jobspy.bdjobs import BDJobs
+from jobspy.cache import JobStore, ResultCache
+from jobspy.dedup import DedupIndex
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
+from jobspy.metrics import ScrapeMetrics, timed, track_site
 from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.model import JobType, JobPost, Location, JobResponse, Country
+from jobspy.model import DescriptionFormat, SalarySource, Scraper, ScraperInput, Site
+from jobspy.model import dedup_index, known_job_urls
 from jobspy.util import (
     set_logger_level,
     extract_salary,
+    extract_salaries,
     create_logger,
     get_enum_from_value,
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    JobFrameBuilder,
+    save_state,
+    convert_descriptions,
+    extract_emails_from_text,
+    is_remote_text,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,
+}
+
+# sites whose scrapers fetch descriptions as HTML and convert them to the
+# requested description_format
+HTML_DESCRIPTION_SITES = {
+    Site.LINKEDIN.value,
+    Site.INDEED.value,
+    Site.ZIP_RECRUITER.value,
+    Site.GLASSDOOR.value,
+    Site.NAUKRI.value,
+    Site.BDJOBS.value,
+}
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -43,182 +81,1030 @@ def scrape_jobs(
     ca_cert: str | None = None,
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
+    defer_descriptions: bool = False,
     linkedin_company_ids: list[int] | None = None,
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    description_workers: int | None = None,
+    deadline: float | None = None,
+    site_time_budget: float | None = None,
+    output: str = "pandas",
+    result_cache: ResultCache | None = None,
+    collect_metrics: bool = False,
+    dedupe: bool | DedupIndex = False,
+    job_store: JobStore | None = None,
+    stop_after_known: int = 20,
     **kwargs,
 ) -> pd.DataFrame:
     """
-    Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
-    """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-    }
+    Scrapes job data from job boards concurrently.
+    With deadline (seconds for the whole call) or site_time_budget (seconds per
+    site), each site stops when its time runs out and keeps the jobs found so far.
+    With description_workers, scrapers keep descriptions as HTML and they are
+    converted to description_format afterwards in that many worker processes
+    With defer_descriptions, LinkedIn, ZipRecruiter, Glassdoor and BDJobs skip
+    their job page requests; fetch them later with hydrate_descriptions.
+    With a result_cache, each site's jobs are served from it when the same search
+    ran within its ttl, without any requests.
+    With collect_metrics, the time each site spent on the network, rate limit
+    waits, parsing, description conversion, validation and row assembly, with its
+    request and byte counts, is returned in df.attrs["metrics"] (the
+    "jobspy.metrics" JSON schema metadata of an arrow Table).
+    With dedupe, near-duplicate postings (the same job on several sites, see
+    jobspy.dedup.DedupIndex) are dropped, keeping the first one scraped, and
+    scrapers skip fetching the job pages of duplicates. Pass a DedupIndex to
+    also drop the jobs it already holds, e.g. from earlier runs.
+    With a job_store, the scrape is incremental: jobs returned by earlier runs
+    with the same store are left out (and their job pages not fetched), and a
+    site stops paging after stop_after_known of them in a row.
+    :param output: "pandas", or "arrow" for a pyarrow Table with a fixed schema
+    :return: Pandas DataFrame (or pyarrow Table) containing job data
+    """
+    if output not in ("pandas", "arrow"):
+        raise ValueError(f"Invalid output: {output}, use 'pandas' or 'arrow'")
+    convert_format = DescriptionFormat(description_format)
+    if description_workers and convert_format != DescriptionFormat.HTML:
+        description_format = DescriptionFormat.HTML.value
+    else:
+        description_workers = None
+    metrics = ScrapeMetrics() if collect_metrics else None
+    rows = list(
+        iter_jobs(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            defer_descriptions=defer_descriptions,
+            linkedin_company_ids=linkedin_company_ids,
+            offset=offset,
+            hours_old=hours_old,
+            enforce_annual_salary=enforce_annual_salary,
+            verbose=verbose,
+            user_agent=user_agent,
+            deadline=deadline,
+            site_time_budget=site_time_budget,
+            result_cache=result_cache,
+            metrics=metrics,
+            dedupe=dedupe,
+            job_store=job_store,
+            stop_after_known=stop_after_known,
+            description_salaries=False,
+            **kwargs,
+        )
+    )
+    return _build_jobs(
+        rows,
+        Country.from_string(country_indeed),
+        enforce_annual_salary,
+        convert_format,
+        description_workers,
+        output,
+        metrics,
+    )
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    defer_descriptions: bool = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    deadline: float | None = None,
+    site_time_budget: float | None = None,
+    result_cache: ResultCache | None = None,
+    metrics: ScrapeMetrics | None = None,
+    dedupe: bool | DedupIndex = False,
+    job_store: JobStore | None = None,
+    stop_after_known: int = 20,
+    description_salaries: bool = True,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Scrapes job data from job boards concurrently, yielding each job as soon as
+    its page is parsed. Rows have the same keys as the scrape_jobs columns and
+    arrive unsorted, interleaved across sites. Each site's timings are added to
+    metrics if given. dedupe drops near-duplicates and job_store makes the
+    scrape incremental as in scrape_jobs. Without description_salaries the rows
+    of US jobs without compensation have no salary keys, for the caller to
+    extract them from the descriptions in one batch as scrape_jobs does.
+    :return: Iterator of job rows
+    """
     set_logger_level(verbose)
-    job_type = get_enum_from_value(job_type) if job_type else None
-
-    def get_site_type():
-        site_types = list(Site)
-        if isinstance(site_name, str):
-            site_types = [map_str_to_site(site_name)]
-        elif isinstance(site_name, Site):
-            site_types = [site_name]
-        elif isinstance(site_name, list):
-            site_types = [
-                map_str_to_site(site) if isinstance(site, str) else site
-                for site in site_name
-            ]
-        return site_types
-
-    country_enum = Country.from_string(country_indeed)
-
-    scraper_input = ScraperInput(
-        site_type=get_site_type(),
-        country=country_enum,
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        country_indeed=country_indeed,
+        job_type=job_type,
         search_term=search_term,
         google_search_term=google_search_term,
         location=location,
         distance=distance,
         is_remote=is_remote,
-        job_type=job_type,
         easy_apply=easy_apply,
         description_format=description_format,
         linkedin_fetch_description=linkedin_fetch_description,
+        defer_descriptions=defer_descriptions,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
         offset=offset,
         hours_old=hours_old,
     )
+    country_enum = scraper_input.country
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+    index = dedupe if isinstance(dedupe, DedupIndex) else None
+    if dedupe is True:
+        index = DedupIndex()
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
+    def scrape_site(site: Site, known: Container[str] | None) -> Iterator[JobPost]:
+        site_deadline = _site_deadline(deadline_at, site_time_budget)
         scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
+        jobs = _scrape_iter_cached(
+            site,
+            lambda: scraper_class(
+                proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+            ),
+            scraper_input,
+            site_deadline,
+            result_cache,
+        )
+        if known is not None:
+            jobs = _skip_known(jobs, site, job_store, known, stop_after_known)
+        yield from jobs
+        _log_finished(site)
 
-    site_to_jobs_dict = {}
+    # bounded so that sites pause scraping while the consumer is behind
+    rows: Queue = Queue(maxsize=500)
+    site_done = object()
+    stop = threading.Event()
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                rows.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
 
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
+    def worker(site: Site):
+        token = dedup_index.set(index)
+        known = job_store.known_urls(site) if job_store else None
+        known_token = known_job_urls.set(known)
+        with track_site(metrics, site.value):
+            jobs = scrape_site(site, known)
+            try:
+                for job in jobs:
+                    if index is not None and index.add_job(job) is not None:
+                        continue
+                    with timed("assemble"):
+                        row = _job_to_row(
+                            job,
+                            site.value,
+                            country_enum,
+                            enforce_annual_salary,
+                            description_salaries,
+                        )
+                    if metrics:
+                        metrics.site(site.value).jobs += 1
+                    if not put(row):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            finally:
+                jobs.close()
+                dedup_index.reset(token)
+                known_job_urls.reset(known_token)
+        put(site_done)
+
+    executor = ThreadPoolExecutor()
+    for site in scraper_input.site_type:
+        executor.submit(worker, site)
+    sites_left = len(scraper_input.site_type)
+    delivered = []
+    try:
+        while sites_left:
+            item = rows.get()
+            if item is site_done:
+                sites_left -= 1
+            elif isinstance(item, Exception):
+                raise item
             else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
+                if job_store:
+                    delivered.append((item["site"], item["job_url"]))
+                yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        if job_store:
+            _store_job_urls(job_store, delivered)
+        save_state()
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    defer_descriptions: bool = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    description_workers: int | None = None,
+    deadline: float | None = None,
+    site_time_budget: float | None = None,
+    output: str = "pandas",
+    result_cache: ResultCache | None = None,
+    collect_metrics: bool = False,
+    dedupe: bool | DedupIndex = False,
+    job_store: JobStore | None = None,
+    stop_after_known: int = 20,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes job data from job boards concurrently on the running event loop.
+    Blocking requests run in the loop's default executor one page step at a
+    time and the pauses between pages are awaited, so many calls can share one
+    loop without holding a thread per site while it waits. Takes the parameters
+    of scrape_jobs
+    :return: Pandas DataFrame (or pyarrow Table) containing job data
+    """
+    if output not in ("pandas", "arrow"):
+        raise ValueError(f"Invalid output: {output}, use 'pandas' or 'arrow'")
+    convert_format = DescriptionFormat(description_format)
+    if description_workers and convert_format != DescriptionFormat.HTML:
+        description_format = DescriptionFormat.HTML.value
+    else:
+        description_workers = None
+    metrics = ScrapeMetrics() if collect_metrics else None
+    set_logger_level(verbose)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        country_indeed=country_indeed,
+        job_type=job_type,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        defer_descriptions=defer_descriptions,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+    )
+
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+    index = dedupe if isinstance(dedupe, DedupIndex) else None
+    if dedupe is True:
+        index = DedupIndex()
+    session = {"proxies": proxies, "ca_cert": ca_cert, "user_agent": user_agent}
+
+    async def scrape_site(site: Site) -> list[dict]:
+        # each task runs in its own copy of the context
+        dedup_index.set(index)
+        known = job_store.known_urls(site) if job_store else None
+        known_job_urls.set(known)
+        site_deadline = _site_deadline(deadline_at, site_time_budget)
+        jobs = _scrape_aiter_cached(
+            site, scraper_input.model_copy(), site_deadline, result_cache, **session
+        )
+        if known is not None:
+            jobs = _askip_known(jobs, site, job_store, known, stop_after_known)
+        rows = []
+        with track_site(metrics, site.value):
+            async with aclosing(jobs):
+                async for job in jobs:
+                    if index is not None and index.add_job(job) is not None:
+                        continue
+                    with timed("assemble"):
+                        row = _job_to_row(
+                            job,
+                            site.value,
+                            scraper_input.country,
+                            enforce_annual_salary,
+                            description_salaries=False,
+                        )
+                    if metrics:
+                        metrics.site(site.value).jobs += 1
+                    rows.append(row)
+        _log_finished(site)
+        return rows
+
+    site_rows = await asyncio.gather(
+        *(scrape_site(site) for site in scraper_input.site_type)
+    )
+    save_state()
+    rows = [row for rows in site_rows for row in rows]
+    if job_store:
+        _store_job_urls(job_store, [(row["site"], row["job_url"]) for row in rows])
+    return _build_jobs(
+        rows,
+        scraper_input.country,
+        enforce_annual_salary,
+        convert_format,
+        description_workers,
+        output,
+        metrics,
+    )
+
+
+# scrape_jobs arguments a scrape_jobs_many query can override
+query_fields = [
+    "site_name",
+    "search_term",
+    "google_search_term",
+    "location",
+    "distance",
+    "is_remote",
+    "job_type",
+    "easy_apply",
+    "results_wanted",
+    "linkedin_company_ids",
+    "offset",
+    "hours_old",
+]
+
+
+def scrape_jobs_many(
+    queries: list[str | dict],
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    defer_descriptions: bool = False,
+    linkedin_company_ids: list[int] | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    user_agent: str = None,
+    deadline: float | None = None,
+    site_time_budget: float | None = None,
+    result_cache: ResultCache | None = None,
+    job_store: JobStore | None = None,
+    stop_after_known: int = 20,
+    description_workers: int | None = None,
+    collect_metrics: bool = False,
+    dedupe: bool | DedupIndex = False,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes job data for many searches, running each site's searches in order on
+    one scraper so sessions, tokens and location lookups are shared. A query is
+    either a search term or a dict overriding any of query_fields; the other
+    arguments apply to every query. site_time_budget covers all of a site's
+    queries, and queries not started before it runs out are skipped. With a
+    job_store each query is incremental, and description_workers,
+    collect_metrics and dedupe (across all queries) work as in scrape_jobs.
+    The searches that failed on a site are listed in df.attrs["errors"] as
+    dicts of query_id, site and error, so they can be told from searches
+    without results.
+    :return: Pandas DataFrame containing job data with a query_id column holding
+    the index of the query in queries
+    """
+    set_logger_level(verbose)
+    convert_format = DescriptionFormat(description_format)
+    if description_workers and convert_format != DescriptionFormat.HTML:
+        description_format = DescriptionFormat.HTML.value
+    else:
+        description_workers = None
+    metrics = ScrapeMetrics() if collect_metrics else None
+    index = dedupe if isinstance(dedupe, DedupIndex) else None
+    if dedupe is True:
+        index = DedupIndex()
+    criteria = dict(
+        site_name=site_name,
+        country_indeed=country_indeed,
+        job_type=job_type,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        defer_descriptions=defer_descriptions,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        offset=offset,
+        hours_old=hours_old,
+    )
+    scraper_inputs = []
+    for query in queries:
+        if isinstance(query, str):
+            query = {"search_term": query}
+        unknown_fields = set(query) - set(query_fields)
+        if unknown_fields:
+            raise ValueError(f"Invalid query fields: {', '.join(unknown_fields)}")
+        scraper_inputs.append(_build_scraper_input(**{**criteria, **query}))
+
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    def scrape_site(site: Site) -> tuple[list[dict], list[dict]]:
+        site_deadline = _site_deadline(deadline_at, site_time_budget)
+        scraper = None
+        # the scraper if it ran the current query, None if served from the cache
+        query_scraper = None
+
+        def get_scraper() -> Scraper:
+            # one scraper for every query, built on the first cache miss
+            nonlocal scraper, query_scraper
+            if scraper is None:
+                scraper = SCRAPER_MAPPING[site](
+                    proxies=proxies, ca_cert=ca_cert, user_agent=user_agent
+                )
+            query_scraper = scraper
+            return scraper
+
+        known = job_store.known_urls(site) if job_store else None
+        token = known_job_urls.set(known)
+        index_token = dedup_index.set(index)
+        rows = []
+        errors = []
+        try:
+            with track_site(metrics, site.value):
+                for query_id, scraper_input in enumerate(scraper_inputs):
+                    if site not in scraper_input.site_type:
+                        continue
+                    if site_deadline is not None and time.monotonic() >= site_deadline:
+                        break
+                    query_scraper = None
+                    jobs = _scrape_iter_cached(
+                        site,
+                        get_scraper,
+                        scraper_input.model_copy(),
+                        site_deadline,
+                        result_cache,
                     )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
+                    if known is not None:
+                        jobs = _skip_known(
+                            jobs, site, job_store, known, stop_after_known
+                        )
+                    try:
+                        for job in jobs:
+                            if index is not None and index.add_job(job) is not None:
+                                continue
+                            with timed("assemble"):
+                                row = _job_to_row(
+                                    job,
+                                    site.value,
+                                    scraper_input.country,
+                                    enforce_annual_salary,
+                                    description_salaries=False,
+                                )
+                            row["query_id"] = query_id
+                            if metrics:
+                                metrics.site(site.value).jobs += 1
+                            rows.append(row)
+                    except Exception as e:
+                        _site_logger(site).error(f"query {query_id} failed: {str(e)}")
+                        error = str(e)
+                    else:
+                        failed = query_scraper is not None and query_scraper.failed
+                        error = "search stopped on an error" if failed else None
+                    if error is not None:
+                        errors.append(
+                            {"query_id": query_id, "site": site.value, "error": error}
+                        )
+        finally:
+            dedup_index.reset(index_token)
+            known_job_urls.reset(token)
+        _log_finished(site)
+        return rows, errors
+
+    sites = list(dict.fromkeys(site for si in scraper_inputs for site in si.site_type))
+    rows = []
+    errors = []
+    with ThreadPoolExecutor() as executor:
+        for site_rows, site_errors in executor.map(scrape_site, sites):
+            rows += site_rows
+            errors += site_errors
+    if job_store:
+        _store_job_urls(job_store, [(row["site"], row["job_url"]) for row in rows])
+    save_state()
+    jobs = _build_jobs(
+        rows,
+        Country.from_string(country_indeed),
+        enforce_annual_salary,
+        convert_format,
+        description_workers,
+        "pandas",
+        metrics,
+        columns=["query_id", *desired_order],
+    )
+    jobs.attrs["errors"] = errors
+    return jobs
+
+
+def hydrate_descriptions(
+    jobs: pd.DataFrame,
+    ids: list[str] | None = None,
+    description_format: str = "markdown",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    user_agent: str = None,
+    verbose: int = 0,
+    country_indeed: str = "usa",
+    enforce_annual_salary: bool = False,
+) -> pd.DataFrame:
+    """
+    Fetches the descriptions and other job page details that scrape_jobs skipped
+    with defer_descriptions, only for the jobs with the given ids (default all)
+    that have no description yet. Sites are fetched concurrently, each site's
+    jobs in order on one scraper. As scrape_jobs would have, the fetched
+    descriptions fill in missing salaries (for country_indeed USA) and mark
+    remote jobs.
+    :return: copy of jobs with the fetched columns filled in
+    """
+    set_logger_level(verbose)
+    jobs = jobs.copy()
+    pending = jobs["description"].isna() | (jobs["description"] == "")
+    if ids is not None:
+        pending &= jobs["id"].isin(ids)
+
+    def hydrate_site(site: Site) -> list[tuple[int, dict]]:
+        scraper_class = SCRAPER_MAPPING[site]
+        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        scraper.scraper_input = ScraperInput(
+            site_type=[site], description_format=description_format
+        )
+        site_jobs = jobs.loc[pending & (jobs["site"] == site.value)]
+        details = []
+        for index, job_id, job_url in zip(
+            site_jobs.index, site_jobs["id"], site_jobs["job_url"]
+        ):
+            try:
+                details.append((index, scraper.fetch_details(job_id, job_url)))
+            except Exception as e:
+                _site_logger(site).error(f"details of {job_id} failed: {str(e)}")
+        return details
+
+    sites = [Site(site) for site in jobs.loc[pending, "site"].unique()]
+    hydrated = []
+    with ThreadPoolExecutor() as executor:
+        for details in executor.map(hydrate_site, sites):
+            for index, job_details in details:
+                for column, value in job_details.items():
+                    if column not in jobs.columns or value in (None, "", []):
+                        continue
+                    if column == "job_type" and isinstance(value, list):
+                        value = ", ".join(job_type.value[0] for job_type in value)
+                    jobs.at[index, column] = value
+                description = job_details.get("description")
+                if description:
+                    emails = extract_emails_from_text(description)
+                    jobs.at[index, "emails"] = ", ".join(emails) if emails else None
+                    hydrated.append(index)
+
+    for index in hydrated:
+        is_remote = jobs.at[index, "is_remote"]
+        if not (pd.notna(is_remote) and is_remote):
+            jobs.at[index, "is_remote"] = is_remote_text(
+                jobs.at[index, "title"],
+                jobs.at[index, "description"],
+                jobs.at[index, "location"],
+            )
+    if Country.from_string(country_indeed) == Country.USA:
+        unpriced = [
+            index
+            for index in hydrated
+            if pd.isna(jobs.at[index, "salary_source"])
+            or not jobs.at[index, "salary_source"]
+        ]
+        rows = [{"description": jobs.at[index, "description"]} for index in unpriced]
+        _extract_description_salaries(rows, enforce_annual_salary)
+        for index, row in zip(unpriced, rows):
+            for column, value in row.items():
+                if column != "description":
+                    jobs.at[index, column] = value
+    save_state()
+    return jobs
+
+
+def _build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    country_indeed: str,
+    job_type: str | None,
+    **criteria,
+) -> ScraperInput:
+    """
+    Resolves the site, country and job type arguments of scrape_jobs into a
+    ScraperInput with the remaining search criteria
+    """
+    site_types = list(Site)
+    if isinstance(site_name, str):
+        site_types = [map_str_to_site(site_name)]
+    elif isinstance(site_name, Site):
+        site_types = [site_name]
+    elif isinstance(site_name, list):
+        site_types = [
+            map_str_to_site(site) if isinstance(site, str) else site
+            for site in site_name
+        ]
+    return ScraperInput(
+        site_type=site_types,
+        country=Country.from_string(country_indeed),
+        job_type=get_enum_from_value(job_type) if job_type else None,
+        **criteria,
+    )
+
+
+def _build_jobs(
+    rows: list[dict],
+    country: Country,
+    enforce_annual_salary: bool,
+    convert_format: DescriptionFormat,
+    description_workers: int | None,
+    output: str,
+    metrics: ScrapeMetrics | None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Finishes the rows of scrape_jobs, scrape_jobs_async and scrape_jobs_many:
+    extracts the salaries of their descriptions, converts the descriptions kept
+    as HTML for description_workers and builds the DataFrame (or arrow Table) of
+    output, with columns (default desired_order)
+    """
+    if country == Country.USA:
+        start = time.perf_counter()
+        _extract_description_salaries(rows, enforce_annual_salary)
+        if metrics:
+            metrics.stages["salaries"] = time.perf_counter() - start
+    if description_workers:
+        start = time.perf_counter()
+        html_rows = [row for row in rows if row["site"] in HTML_DESCRIPTION_SITES]
+        descriptions = convert_descriptions(
+            [row["description"] for row in html_rows],
+            convert_format,
+            description_workers,
+        )
+        for row, description in zip(html_rows, descriptions):
+            row["description"] = description
+        if metrics:
+            metrics.stages["convert"] = time.perf_counter() - start
+    start = time.perf_counter()
+    frame_builder = JobFrameBuilder(columns)
+    frame_builder.extend(rows)
+    if output == "arrow":
+        from jobspy.arrow import jobs_table
 
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
+        jobs = jobs_table(frame_builder.buffers)
+    else:
+        jobs = frame_builder.build()
+    if metrics:
+        metrics.stages["assemble"] = time.perf_counter() - start
+        metrics.finish()
+        if output == "arrow":
+            metadata = {b"jobspy.metrics": json.dumps(metrics.to_dict())}
+            jobs = jobs.replace_schema_metadata(
+                {**(jobs.schema.metadata or {}), **metadata}
             )
+        else:
+            jobs.attrs["metrics"] = metrics.to_dict()
+    return jobs
+
+
+def _scrape_iter_cached(
+    site: Site,
+    get_scraper: Callable[[], Scraper],
+    scraper_input: ScraperInput,
+    deadline: float | None,
+    result_cache: ResultCache | None,
+) -> Iterator[JobPost]:
+    """
+    scrape_iter of the scraper get_scraper returns, served from result_cache
+    without building the scraper when it has the search. Completed results are
+    saved to it, but not empty ones, ones cut short by an error or the deadline,
+    or ones missing the duplicates dropped by a dedup index or the details of
+    jobs known to an incremental scrape
+    """
+    # scrapers may adjust their input, so the key is taken from a copy
+    cache_input = scraper_input.model_copy(deep=True)
+    jobs = result_cache.get(cache_input, site) if result_cache else None
+    if jobs is not None:
+        yield from jobs
+        return
+    scraper = get_scraper()
+    jobs = []
+    for job in scraper.scrape_iter(scraper_input, deadline):
+        jobs.append(job)
+        yield job
+    if (
+        result_cache
+        and jobs
+        and scraper.completed
+        and dedup_index.get() is None
+        and known_job_urls.get() is None
+    ):
+        result_cache.put(cache_input, site, jobs)
+
+
+async def _scrape_aiter_cached(
+    site: Site,
+    scraper_input: ScraperInput,
+    deadline: float | None,
+    result_cache: ResultCache | None,
+    **session,
+) -> AsyncIterator[JobPost]:
+    """
+    Async counterpart of _scrape_iter_cached, building the scraper with the
+    session arguments in the loop's default executor on a cache miss
+    """
+    cache_input = scraper_input.model_copy(deep=True)
+    jobs = result_cache.get(cache_input, site) if result_cache else None
+    if jobs is not None:
+        for job in jobs:
+            yield job
+        return
+    scraper = await asyncio.to_thread(SCRAPER_MAPPING[site], **session)
+    jobs = []
+    async for job in scraper.scrape_aiter(scraper_input, deadline):
+        jobs.append(job)
+        yield job
+    if (
+        result_cache
+        and jobs
+        and scraper.completed
+        and dedup_index.get() is None
+        and known_job_urls.get() is None
+    ):
+        result_cache.put(cache_input, site, jobs)
+
+
+class _KnownRun:
+    """
+    State of _skip_known and _askip_known over a site's jobs: the known urls seen
+    again and how many known jobs came in a row
+    """
+
+    def __init__(
+        self,
+        site: Site,
+        job_store: JobStore,
+        known: Container[str],
+        stop_after_known: int,
+    ):
+        self.site = site
+        self.job_store = job_store
+        self.known = known
+        self.stop_after_known = stop_after_known
+        self.seen_urls = []
+        self.run = 0
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
+    def is_known(self, job: JobPost) -> bool:
+        """
+        :return: whether an earlier run returned job, so it is left out
+        """
+        if job.job_url not in self.known:
+            self.run = 0
+            return False
+        self.seen_urls.append(job.job_url)
+        self.run += 1
+        if self.stopped:
+            _site_logger(self.site).info(
+                f"stopped after {self.run} known jobs in a row"
             )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
+        return True
+
+    @property
+    def stopped(self) -> bool:
+        return self.run >= self.stop_after_known
+
+    def save(self):
+        self.job_store.add(self.site, self.seen_urls)
+
+
+def _skip_known(
+    jobs: Iterator[JobPost],
+    site: Site,
+    job_store: JobStore,
+    known: Container[str],
+    stop_after_known: int,
+) -> Iterator[JobPost]:
+    """
+    Leaves out the jobs earlier runs returned, by their urls in known, and stops
+    the scrape once stop_after_known of them come in a row. The known urls seen
+    again are refreshed in job_store. New ones are recorded by the caller once
+    their rows are delivered, see _store_job_urls
+    """
+    known_run = _KnownRun(site, job_store, known, stop_after_known)
+    try:
+        for job in jobs:
+            if not known_run.is_known(job):
+                yield job
+            elif known_run.stopped:
+                return
+    finally:
+        jobs.close()
+        known_run.save()
+
+
+async def _askip_known(
+    jobs: AsyncIterator[JobPost],
+    site: Site,
+    job_store: JobStore,
+    known: Container[str],
+    stop_after_known: int,
+) -> AsyncIterator[JobPost]:
+    """
+    Async variant of _skip_known
+    """
+    known_run = _KnownRun(site, job_store, known, stop_after_known)
+    try:
+        async for job in jobs:
+            if not known_run.is_known(job):
+                yield job
+            elif known_run.stopped:
+                return
+    finally:
+        await jobs.aclose()
+        known_run.save()
+
+
+def _store_job_urls(job_store: JobStore, delivered: list[tuple[str, str]]):
+    """
+    Records the (site, job_url) of the rows handed to the caller in job_store,
+    so that jobs scraped but never delivered are not taken as known next run
+    """
+    urls_by_site = defaultdict(list)
+    for site, job_url in delivered:
+        urls_by_site[site].append(job_url)
+    for site, job_urls in urls_by_site.items():
+        job_store.add(Site(site), job_urls)
+
+
+def _site_deadline(
+    deadline_at: float | None, site_time_budget: float | None
+) -> float | None:
+    """
+    time.monotonic() by which a site starting now has to finish
+    """
+    if site_time_budget is None:
+        return deadline_at
+    site_deadline = time.monotonic() + site_time_budget
+    return site_deadline if deadline_at is None else min(deadline_at, site_deadline)
+
+
+def _site_logger(site: Site):
+    cap_name = site.value.capitalize()
+    site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+    site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
+    return create_logger(site_name)
+
+
+def _log_finished(site: Site):
+    _site_logger(site).info(f"finished scraping")
+
+
+# JobPost fields that are row columns of the same name
+job_row_fields = [field for field in desired_order if field in JobPost.model_fields]
+
+
+def _job_to_row(
+    job: JobPost,
+    site: str,
+    country_enum: Country,
+    enforce_annual_salary: bool,
+    description_salaries: bool = True,
+) -> dict:
+    """
+    Flattens a JobPost into a row keyed by the columns in desired_order. Reads
+    the attributes of the already validated job instead of dumping it to a dict.
+    Without description_salaries, the salary keys of US jobs without
+    compensation are left out, see _extract_description_salaries
+    """
+    job_data = {field: getattr(job, field) for field in job_row_fields}
+    job_data["site"] = site
+    job_data["company"] = job.company_name
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job.job_type)
+        if job.job_type
+        else None
+    )
+    job_data["emails"] = ", ".join(job.emails) if job.emails else None
+    job_data["location"] = job.location.display_location() if job.location else None
+
+    # Handle compensation
+    compensation = job.compensation
+    if compensation:
+        job_data["interval"] = (
+            compensation.interval.value if compensation.interval else None
+        )
+        job_data["min_amount"] = compensation.min_amount
+        job_data["max_amount"] = compensation.max_amount
+        job_data["currency"] = compensation.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
     else:
-        return pd.DataFrame()
+        if country_enum == Country.USA and description_salaries:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(
+                job_data["description"],
+                enforce_annual_salary=enforce_annual_salary,
+            )
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    job_data["salary_source"] = (
+        job_data["salary_source"] if job_data.get("min_amount") else None
+    )
+
+    # naukri-specific fields
+    job_data["skills"] = ", ".join(job.skills) if job.skills else None
+    return job_data
+
+
+def _extract_description_salaries(rows: list[dict], enforce_annual_salary: bool):
+    """
+    Fills in the salary of the rows left without salary keys by _job_to_row from
+    their descriptions, running extract_salaries over all of them at once
+    """
+    pending = [row for row in rows if "min_amount" not in row]
+    if not pending:
+        return
+    salaries = extract_salaries(
+        [row["description"] for row in pending],
+        enforce_annual_salary=enforce_annual_salary,
+    )
+    for row, interval, min_amount, max_amount, currency in zip(
+        pending,
+        salaries["interval"].tolist(),
+        salaries["min_amount"].tolist(),
+        salaries["max_amount"].tolist(),
+        salaries["currency"].tolist(),
+    ):
+        if not isinstance(interval, str):
+            continue
+        row["interval"] = interval
+        row["min_amount"] = min_amount
+        row["max_amount"] = max_amount
+        row["currency"] = currency
+        row["salary_source"] = SalarySource.DESCRIPTION.value
 
 
 # Add BDJobs to __all__
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    raise ImportError(
+        "Arrow output requires pyarrow, install it with "
+        "`pip install python-jobspy[arrow]`"
+    ) from None
+
+from jobspy.util import JobFrameBuilder
+
+dictionary_string = pa.dictionary(pa.int32(), pa.string())
+
+# fixed schema of the job columns, in desired_order
+job_schema = pa.schema(
+    [
+        ("id", pa.string()),
+        ("site", dictionary_string),
+        ("job_url", pa.string()),
+        ("job_url_direct", pa.string()),
+        ("title", pa.string()),
+        ("company", pa.string()),
+        ("location", pa.string()),
+        ("date_posted", pa.date32()),
+        ("job_type", pa.string()),
+        ("salary_source", dictionary_string),
+        ("interval", dictionary_string),
+        ("min_amount", pa.float64()),
+        ("max_amount", pa.float64()),
+        ("currency", dictionary_string),
+        ("is_remote", pa.bool_()),
+        ("job_level", pa.string()),
+        ("job_function", pa.string()),
+        ("listing_type", pa.string()),
+        ("emails", pa.string()),
+        ("description", pa.string()),
+        ("company_industry", pa.string()),
+        ("company_url", pa.string()),
+        ("company_logo", pa.string()),
+        ("company_url_direct", pa.string()),
+        ("company_addresses", pa.string()),
+        ("company_num_employees", pa.string()),
+        ("company_revenue", pa.string()),
+        ("company_description", pa.string()),
+        ("skills", pa.string()),
+        ("experience_range", pa.string()),
+        ("company_rating", pa.float64()),
+        ("company_reviews_count", pa.int64()),
+        ("vacancy_count", pa.int64()),
+        ("work_from_home_type", pa.string()),
+    ]
+)
+
+
+def jobs_table(columns: dict[str, list], sort: bool = True) -> pa.Table:
+    """
+    Builds a Table with job_schema from one list of values per column, e.g. the
+    buffers of a JobFrameBuilder
+    :param sort: sorts by site and date posted (newest first) like scrape_jobs
+    """
+    arrays = []
+    for field in job_schema:
+        value_type = (
+            field.type.value_type if pa.types.is_dictionary(field.type) else field.type
+        )
+        arrays.append(pa.array(columns[field.name], type=value_type))
+    table = pa.Table.from_arrays(arrays, names=job_schema.names)
+    if sort:
+        table = table.sort_by([("site", "ascending"), ("date_posted", "descending")])
+    for i, field in enumerate(job_schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field, table[i].dictionary_encode())
+    return table
+
+
+def write_parquet(
+    jobs: pa.Table | Iterable[dict],
+    path: str,
+    batch_size: int = 10_000,
+    compression: str = "zstd",
+):
+    """
+    Writes jobs to a Parquet file with job_schema. jobs is either a Table from
+    scrape_jobs(output="arrow") or an iterable of job rows such as iter_jobs(),
+    which is written one row group of batch_size rows at a time without holding
+    all the rows in memory
+    """
+    if isinstance(jobs, pa.Table):
+        pq.write_table(jobs, path, compression=compression)
+        return
+    with pq.ParquetWriter(path, job_schema, compression=compression) as writer:
+        frame_builder = JobFrameBuilder()
+        for row in jobs:
+            frame_builder.append(row)
+            if len(frame_builder) >= batch_size:
+                writer.write_table(jobs_table(frame_builder.buffers, sort=False))
+                frame_builder = JobFrameBuilder()
+        if len(frame_builder):
+            writer.write_table(jobs_table(frame_builder.buffers, sort=False))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import random
-import time
+from typing import Iterator
 
 from bs4 import BeautifulSoup
 
+from jobspy.exception import DeadlineExceeded
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -13,16 +13,15 @@ from jobspy.model import (
     JobResponse,
     Location,
     Country,
+    Pause,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import create_logger, create_session, rate_limiter
 
 log = create_logger("Bayt")
 
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -33,17 +32,24 @@ class BaytScraper(Scraper):
         self.country = "worldwide"
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields Bayt jobs as each results page is parsed.
+        """
         self.scraper_input = scraper_input
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
-        job_list: list[JobPost] = []
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            )
+        job_count = 0
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while job_count < results_wanted:
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -54,32 +60,31 @@ class BaytScraper(Scraper):
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
-            initial_count = len(job_list)
+            initial_count = job_count
             for job in job_elements:
                 try:
                     job_post = self._extract_job_info(job)
-                    if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
-                            break
-                    else:
-                        log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
-                        )
                 except Exception as e:
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
-
-            if len(job_list) == initial_count:
+                if job_post:
+                    job_count += 1
+                    yield job_post
+                    if job_count >= results_wanted:
+                        break
+                else:
+                    log.debug(
+                        "Extraction returned None. Job snippet:\n"
+                        + job.prettify()[:500]
+                    )
+
+            if job_count == initial_count:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+            if job_count < results_wanted:
+                yield rate_limiter.pause(f"{self.base_url}/en/")
 
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
@@ -93,8 +98,11 @@ class BaytScraper(Scraper):
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
+            self.failed = True
             return None
 
     def _extract_job_info(self, job: BeautifulSoup) -> JobPost | None:
@@ -1,16 +1,14 @@
 # __init__.py
 from __future__ import annotations
 
-import random
-import time
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
-from jobspy.exception import BDJobsException
+from jobspy.exception import BDJobsException, DeadlineExceeded
 from jobspy.bdjobs.constant import headers, search_params
 from jobspy.bdjobs.util import (
     parse_location,
@@ -27,6 +25,7 @@ from jobspy.model import (
     ScraperInput,
     Site,
     DescriptionFormat,
+    Pause,
 )
 from jobspy.util import (
     extract_emails_from_text,
@@ -34,6 +33,7 @@ from jobspy.util import (
     create_logger,
     remove_attributes,
     markdown_converter,
+    rate_limiter,
 )
 
 log = create_logger("BDJobs")
@@ -42,11 +42,12 @@ log = create_logger("BDJobs")
 class BDJobs(Scraper):
     base_url = "https://jobs.bdjobs.com"
     search_url = "https://jobs.bdjobs.com/jobsearch.asp"
-    delay = 2
-    band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
@@ -70,8 +71,16 @@ class BDJobs(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields BDJobs jobs with scraper_input criteria as each page is parsed
+        :param scraper_input:
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         page = 1
         request_count = 0
@@ -80,7 +89,7 @@ class BDJobs(Scraper):
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
+        continue_search = lambda: job_count < scraper_input.results_wanted
 
         while continue_search():
             request_count += 1
@@ -99,6 +108,7 @@ class BDJobs(Scraper):
 
                 if response.status_code != 200:
                     log.error(f"BDJobs response status code {response.status_code}")
+                    self.failed = True
                     break
 
                 soup = BeautifulSoup(response.text, "html.parser")
@@ -113,26 +123,30 @@ class BDJobs(Scraper):
                 for job_card in job_cards:
                     try:
                         job_post = self._process_job(job_card)
-                        if job_post and job_post.id not in seen_ids:
-                            seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
-                                break
+                    except DeadlineExceeded:
+                        raise
                     except Exception as e:
                         log.error(f"Error processing job card: {str(e)}")
+                        continue
+                    if job_post and job_post.id not in seen_ids:
+                        seen_ids.add(job_post.id)
+                        job_count += 1
+                        yield job_post
+
+                        if not continue_search():
+                            break
 
                 page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                if continue_search():
+                    yield rate_limiter.pause(self.search_url)
 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 log.error(f"Error during scraping: {str(e)}")
+                self.failed = True
                 break
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
-
     def _process_job(self, job_card: Tag) -> Optional[JobPost]:
         """
         Processes a job card element into a JobPost object
@@ -223,6 +237,9 @@ class BDJobs(Scraper):
                 date_text = date_elem.get_text(strip=True)
                 date_posted = parse_date(date_text)
 
+            if self.is_duplicate(title, company_name, location):
+                return None
+
             # Check if job is remote
             is_remote = is_job_remote(title, location=location)
 
@@ -238,16 +255,24 @@ class BDJobs(Scraper):
                 site=self.site,
             )
 
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
+            # Always fetch description for BDJobs unless deferred or known
+            if not (
+                self.scraper_input.defer_descriptions or self.is_known(job_url)
+            ):
+                job_details = self._get_job_details(job_url)
+                job_post.description = job_details.get("description", "")
+                job_post.job_type = job_details.get("job_type", "")
 
             return job_post
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    def fetch_details(self, job_id: str, job_url: str) -> dict:
+        return self._get_job_details(job_url)
+
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Gets detailed job information from the job page
@@ -348,6 +373,8 @@ class BDJobs(Scraper):
                 "company_industry": company_industry,
             }
 
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             log.error(f"Error getting job details: {str(e)}")
             return {}
@@ -4,6 +4,9 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from jobspy.model import Location, Country
+from jobspy.util import KeywordClassifier, remote_keywords
+
+remote_classifier = KeywordClassifier({"remote": [*remote_keywords, "home based"]})
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -87,14 +90,8 @@ def is_job_remote(title: str, description: str = None, location: Location = None
     :param location: Job location
     :return: True if job is remote, False otherwise
     """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-    
-    # Combine all text fields
-    full_text = title.lower()
-    if description:
-        full_text += " " + description.lower()
-    if location:
-        full_text += " " + location.display_location().lower()
-    
-    # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
+    return bool(
+        remote_classifier.find(
+            title, description, location.display_location() if location else None
+        )
+    )
\ No newline at end of file
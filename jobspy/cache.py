@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from fnmatch import fnmatch
+from typing import Iterable, Iterator
+from urllib.parse import urlparse
+
+import requests
+
+from jobspy.model import JobPost, ScraperInput, Site
+from jobspy.util import build_response, get_cache_dir
+
+
+class SQLiteCache:
+    """
+    Base of the caches kept in a SQLite file, one connection per operation so
+    they can be shared between scraper threads
+    """
+
+    schema = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(self.schema)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+class ResultCache(SQLiteCache):
+    """
+    On-disk cache of each site's scraped jobs, keyed by a hash of the ScraperInput
+    narrowed to that site. Entries expire after ttl seconds and the least recently
+    used ones are evicted beyond max_entries
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+        "site TEXT, created_at REAL, accessed_at REAL, jobs BLOB)"
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl: float = 3600,
+        max_entries: int = 1000,
+    ):
+        super().__init__(path or os.path.join(get_cache_dir(), "results.sqlite"))
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(scraper_input: ScraperInput, site: Site) -> str:
+        site_input = scraper_input.model_copy(update={"site_type": [site]})
+        return hashlib.sha256(site_input.model_dump_json().encode()).hexdigest()
+
+    def get(self, scraper_input: ScraperInput, site: Site) -> list[JobPost] | None:
+        """
+        :return: the cached jobs, None if missing or expired
+        """
+        key = self.key(scraper_input, site)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT jobs FROM results WHERE key = ? AND created_at > ?",
+                (key, now - self.ttl),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])
+
+    def put(self, scraper_input: ScraperInput, site: Site, jobs: list[JobPost]):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                (
+                    self.key(scraper_input, site),
+                    site.value,
+                    now,
+                    now,
+                    pickle.dumps(jobs, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+            conn.execute("DELETE FROM results WHERE created_at <= ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM results")
+
+
+# seconds job detail pages stay cached, by glob over the lowercased host and path
+default_http_cache_ttls = {
+    "www.linkedin.com/jobs/view/*": 7 * 24 * 3600,
+    "www.ziprecruiter.com/jobs/*": 7 * 24 * 3600,
+    "jobs.bdjobs.com/*jobdetail*": 7 * 24 * 3600,
+}
+
+
+class HttpCache(SQLiteCache):
+    """
+    On-disk cache of GET responses for the URLs matching a pattern of ttls,
+    used by every session once installed with jobspy.util.set_http_cache.
+    Bodies are stored compressed and the least recently used responses are
+    evicted once they add up to more than max_bytes
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, "
+        "expires_at REAL, accessed_at REAL, size INTEGER, status_code INTEGER, "
+        "final_url TEXT, headers TEXT, body BLOB)"
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        super().__init__(path or os.path.join(get_cache_dir(), "http.sqlite"))
+        self.ttls = dict(default_http_cache_ttls if ttls is None else ttls)
+        self.max_bytes = max_bytes
+
+    def ttl(self, url: str) -> float | None:
+        """
+        :return: seconds responses of url are cached, None if it is not cached
+        """
+        parsed = urlparse(url)
+        target = f"{parsed.hostname}{parsed.path}".lower()
+        for pattern, ttl in self.ttls.items():
+            if fnmatch(target, pattern):
+                return ttl
+        return None
+
+    def get(self, url: str) -> requests.Response | None:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT status_code, final_url, headers, body FROM responses "
+                "WHERE url = ? AND expires_at > ?",
+                (url, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+            )
+        status_code, final_url, headers, body = row
+        return build_response(
+            status_code, final_url, json.loads(headers), zlib.decompress(body)
+        )
+
+    def put(self, url: str, response):
+        """
+        Stores a requests or tls_client response to url for the ttl of its pattern
+        """
+        ttl = self.ttl(url)
+        if ttl is None:
+            return
+        now = time.time()
+        body = zlib.compress(response.content)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    now + ttl,
+                    now,
+                    len(body),
+                    response.status_code,
+                    str(response.url),
+                    json.dumps(dict(response.headers)),
+                    body,
+                ),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM responses WHERE url IN (SELECT url FROM (SELECT url, "
+                "SUM(size) OVER (ORDER BY accessed_at DESC) AS total "
+                "FROM responses) WHERE total > ?)",
+                (self.max_bytes,),
+            )
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+class DescriptionStore(SQLiteCache):
+    """
+    On-disk store of converted descriptions behind a ConversionCache, keyed by
+    the hash of their HTML and format. Texts are stored compressed for ttl
+    seconds, and trimmed to the max_entries most recent when the store is opened
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS descriptions (key TEXT PRIMARY KEY, "
+        "created_at REAL, text BLOB)"
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl: float = 30 * 24 * 3600,
+        max_entries: int = 200_000,
+    ):
+        super().__init__(path or os.path.join(get_cache_dir(), "descriptions.sqlite"))
+        self.ttl = ttl
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS descriptions_created_at "
+                "ON descriptions (created_at)"
+            )
+            conn.execute(
+                "DELETE FROM descriptions WHERE key IN (SELECT key FROM "
+                "descriptions ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # a lost write only costs a conversion, so commits are not synced to disk
+        with super()._connect() as conn:
+            conn.execute("PRAGMA synchronous = OFF")
+            yield conn
+
+    def get(self, key: str) -> str | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT text FROM descriptions WHERE key = ? AND created_at > ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+        return zlib.decompress(row[0]).decode() if row else None
+
+    def put(self, key: str, text: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?)",
+                (key, now, zlib.compress(text.encode())),
+            )
+            conn.execute(
+                "DELETE FROM descriptions WHERE created_at <= ?", (now - self.ttl,)
+            )
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM descriptions")
+
+
+class BloomFilter:
+    """
+    Bloom filter kept in a memory-mapped file, so that its memory use does not
+    grow with the keys added and it persists across runs. Lookups never miss a
+    key that was added, and wrongly match one that was not with a probability
+    of about error_rate as long as no more than capacity keys are added
+    """
+
+    header = struct.Struct("<8sQQQQ")
+    magic = b"JSBLOOM1"
+
+    def __init__(self, path: str, capacity: int = 10_000_000, error_rate: float = 0.01):
+        self.path = path
+        self.lock = threading.Lock()
+        if not os.path.exists(path):
+            self.create(path, capacity, error_rate)
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        magic, self.bit_count, self.hash_count, self.capacity, _ = (
+            self.header.unpack_from(self._map)
+        )
+        if magic != self.magic:
+            self.close()
+            raise ValueError(f"{path} is not a bloom filter")
+
+    @classmethod
+    def create(cls, path: str, capacity: int, error_rate: float):
+        """
+        Writes an empty filter sized for capacity keys to path
+        """
+        capacity = max(capacity, 1)
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hash_count = max(1, round(bit_count / capacity * math.log(2)))
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(cls.header.pack(cls.magic, bit_count, hash_count, capacity, 0))
+            f.truncate(cls.header.size + (bit_count + 7) // 8)
+
+    @property
+    def count(self) -> int:
+        """
+        Number of distinct keys added, approximately
+        """
+        return self.header.unpack_from(self._map)[4]
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bit_count for i in range(self.hash_count)]
+
+    def __contains__(self, key: str) -> bool:
+        offset = self.header.size
+        return all(
+            self._map[offset + (position >> 3)] >> (position & 7) & 1
+            for position in self._positions(key)
+        )
+
+    def add(self, key: str) -> bool:
+        """
+        :return: whether the key was new to the filter
+        """
+        offset = self.header.size
+        added = False
+        with self.lock:
+            for position in self._positions(key):
+                index = offset + (position >> 3)
+                byte = self._map[index]
+                bit = 1 << (position & 7)
+                if not byte & bit:
+                    self._map[index] = byte | bit
+                    added = True
+            if added:
+                self.header.pack_into(
+                    self._map,
+                    0,
+                    self.magic,
+                    self.bit_count,
+                    self.hash_count,
+                    self.capacity,
+                    self.count + 1,
+                )
+        return added
+
+    def clear(self):
+        with self.lock:
+            self._map[self.header.size :] = bytes(len(self._map) - self.header.size)
+            self.header.pack_into(
+                self._map,
+                0,
+                self.magic,
+                self.bit_count,
+                self.hash_count,
+                self.capacity,
+                0,
+            )
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class KnownUrls:
+    """
+    Urls of the jobs a site returned in earlier runs, as returned by
+    JobStore.known_urls. Urls the bloom filter does not match are answered
+    without touching the database, the few it matches are looked up in it
+    """
+
+    def __init__(self, store: JobStore, site: Site):
+        self.store = store
+        self.site = site
+
+    def __contains__(self, job_url: str) -> bool:
+        if self.store.filter_key(self.site, job_url) not in self.store.filter:
+            return False
+        return self.store.contains(self.site, job_url)
+
+
+class JobStore(SQLiteCache):
+    """
+    On-disk record of the urls of the jobs each site returned, for incremental
+    scrapes that skip the jobs earlier runs collected and stop paging once they
+    reach them. Urls not seen again for ttl seconds are forgotten.
+
+    A bloom filter in a memory-mapped file next to the database answers most
+    lookups, so memory stays constant with tens of millions of urls stored. It
+    is rebuilt from the database, twice as large, when opened with more urls
+    than its capacity
+    """
+
+    schema = (
+        "CREATE TABLE IF NOT EXISTS jobs (site TEXT, job_url TEXT, seen_at REAL, "
+        "PRIMARY KEY (site, job_url))"
+    )
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl: float = 90 * 24 * 3600,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.01,
+    ):
+        """
+        :param capacity: urls the bloom filter is sized for
+        :param error_rate: share of unknown urls the filter passes on to the
+        database at capacity
+        """
+        super().__init__(path or os.path.join(get_cache_dir(), "jobs.sqlite"))
+        self.ttl = ttl
+        self.error_rate = error_rate
+        self.filter_path = f"{self.path}.bloom"
+        if not os.path.exists(self.filter_path):
+            self._build_filter(capacity)
+        self.filter = BloomFilter(self.filter_path)
+        if self.filter.count > self.filter.capacity:
+            capacity = 2 * self.filter.count
+            self.filter.close()
+            self._build_filter(capacity)
+            self.filter = BloomFilter(self.filter_path)
+
+    @staticmethod
+    def filter_key(site: Site, job_url: str) -> str:
+        return f"{site.value} {job_url}"
+
+    def _build_filter(self, capacity: int):
+        """
+        Writes a bloom filter of the stored urls to filter_path
+        """
+        tmp_path = f"{self.filter_path}.tmp"
+        BloomFilter.create(tmp_path, capacity, self.error_rate)
+        bloom = BloomFilter(tmp_path)
+        try:
+            with self._connect() as conn:
+                for site, job_url in conn.execute("SELECT site, job_url FROM jobs"):
+                    bloom.add(f"{site} {job_url}")
+            bloom.flush()
+        finally:
+            bloom.close()
+        os.replace(tmp_path, self.filter_path)
+
+    def known_urls(self, site: Site) -> KnownUrls:
+        return KnownUrls(self, site)
+
+    def contains(self, site: Site, job_url: str) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM jobs WHERE site = ? AND job_url = ? AND seen_at > ?",
+                (site.value, job_url, time.time() - self.ttl),
+            ).fetchone()
+        return row is not None
+
+    def add(self, site: Site, job_urls: Iterable[str]):
+        job_urls = list(job_urls)
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)",
+                ((site.value, job_url, now) for job_url in job_urls),
+            )
+            conn.execute("DELETE FROM jobs WHERE seen_at <= ?", (now - self.ttl,))
+        for job_url in job_urls:
+            self.filter.add(self.filter_key(site, job_url))
+        self.filter.flush()
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM jobs")
+        self.filter.clear()
@@ -0,0 +1,541 @@
+"""
+lxml backend of the description converters, selected with
+jobspy.util.set_converter_backend("lxml"). It walks the tree lxml parses in C
+instead of a BeautifulSoup tree built in Python, and reproduces the output of
+markdownify with its default options and of BeautifulSoup's get_text.
+
+Well-formed HTML converts the same. Malformed HTML may not: lxml repairs it
+the way browsers do (e.g. closes an open <p> or <b> at the next <p> or <ul>)
+where html.parser keeps the tags open, and moves head-only tags (<title>,
+<meta>) out of the body.
+"""
+
+from __future__ import annotations
+
+import re
+
+try:
+    from lxml import etree
+except ImportError:
+    raise ImportError(
+        "The lxml converter backend requires lxml, install it with "
+        "`pip install python-jobspy[lxml]`"
+    ) from None
+
+# huge_tree lifts libxml2's depth limit, past which it drops the rest silently
+html_parser = etree.HTMLParser(huge_tree=True)
+
+heading_pattern = re.compile(r"h(\d+)")
+line_pattern = re.compile(r"^(.*)", flags=re.MULTILINE)
+spaces_pattern = re.compile(r"[\t ]+")
+whitespace_pattern = re.compile(r"[\t \r\n]+")
+newline_pattern = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+pre_lstrip_pattern = re.compile(r"^[ \n]*\n")
+pre_rstrip_pattern = re.compile(r"[ \n]*$")
+backticks_pattern = re.compile(r"`+")
+
+# blocks whose whitespace-only text at their edges and around them is dropped
+block_tags = {
+    "p",
+    "blockquote",
+    "article",
+    "div",
+    "section",
+    "ol",
+    "ul",
+    "li",
+    "dl",
+    "dt",
+    "dd",
+    "table",
+    "thead",
+    "tbody",
+    "tfoot",
+    "tr",
+    "td",
+    "th",
+}
+# tags whose text BeautifulSoup's get_text leaves out
+hidden_text_tags = {"script", "style", "template", "rt", "rp"}
+comment = "#comment"
+
+
+class Node:
+    """
+    Element or text of the parsed description, linked to its siblings like the
+    BeautifulSoup tree markdownify walks. name is None for text and "#comment"
+    for comments and processing instructions
+    """
+
+    __slots__ = (
+        "name",
+        "text",
+        "attrs",
+        "parent",
+        "children",
+        "prev",
+        "next",
+        "block",
+        "spaced",
+    )
+
+    def __init__(self, name: str | None, text: str = "", attrs=None, parent=None):
+        self.name = name
+        self.text = text
+        self.attrs = attrs
+        self.parent = parent
+        self.children: list[Node] = []
+        self.prev: Node | None = None
+        self.next: Node | None = None
+        # whitespace is dropped inside the node (block) and around it (spaced)
+        self.block = name is not None and (
+            name in block_tags or heading_pattern.match(name) is not None
+        )
+        self.spaced = self.block or name == "pre"
+
+    def previous_tags(self, name: str | None = None):
+        node = self.prev
+        while node is not None:
+            if node.name is not None and node.name != comment:
+                if name is None or node.name == name:
+                    yield node
+            node = node.prev
+
+    def find_all(self, names: tuple[str, ...]) -> list[Node]:
+        found = []
+        for child in self.children:
+            if child.name in names:
+                found.append(child)
+            if child.children:
+                found += child.find_all(names)
+        return found
+
+
+def _parse_body(description_html: str):
+    if not description_html or description_html.isspace():
+        return None
+    html = etree.fromstring(
+        f"<html><body>{description_html}</body></html>", html_parser
+    )
+    return html.find("body") if html is not None else None
+
+
+def parse(description_html: str) -> Node:
+    document = Node("[document]")
+    body = _parse_body(description_html)
+    if body is not None:
+        _add_children(document, body)
+    return document
+
+
+def _add_children(node: Node, element):
+    children = node.children
+    if element.text:
+        children.append(Node(None, element.text, parent=node))
+    for child in element:
+        if isinstance(child.tag, str):
+            child_node = Node(child.tag.lower(), attrs=child.attrib, parent=node)
+            _add_children(child_node, child)
+        else:
+            child_node = Node(comment, parent=node)
+        children.append(child_node)
+        if child.tail:
+            children.append(Node(None, child.tail, parent=node))
+    for prev, next_ in zip(children, children[1:]):
+        prev.next = next_
+        next_.prev = prev
+
+
+def to_plain(description_html: str) -> str:
+    """
+    Text of the description with whitespace collapsed, like plain_converter
+    """
+    body = _parse_body(description_html)
+    if body is None:
+        return ""
+    etree.strip_elements(body, *hidden_text_tags, with_tail=False)
+    return re.sub(r"\s+", " ", " ".join(body.itertext())).strip()
+
+
+def to_markdown(description_html: str) -> str:
+    """
+    Markdown of the description, like markdown_converter
+    """
+    return writer.process_tag(parse(description_html), frozenset()).strip()
+
+
+def _split_newlines(text: str) -> tuple[str, str, str]:
+    content = text.strip("\n")
+    if not content:
+        return text, "", ""
+    leading = len(text) - len(text.lstrip("\n"))
+    trailing = len(text) - len(text.rstrip("\n"))
+    return "\n" * leading, content, "\n" * trailing
+
+
+def _is_block_content(node: Node | None) -> bool:
+    if node is None or node.name == comment:
+        return False
+    return node.name is not None or node.text.strip() != ""
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _colspan(node: Node) -> int:
+    colspan = node.attrs.get("colspan", "")
+    return max(1, min(1000, int(colspan))) if colspan.isdigit() else 1
+
+
+class MarkdownWriter:
+    """
+    Port of markdownify.MarkdownConverter with its default options to the
+    Node tree, tag by tag
+    """
+
+    def __init__(self):
+        self.converters = {
+            "a": self.convert_a,
+            "b": self.convert_strong,
+            "strong": self.convert_strong,
+            "em": self.convert_em,
+            "i": self.convert_em,
+            "del": self.convert_del,
+            "s": self.convert_del,
+            "sub": self.convert_plain_inline,
+            "sup": self.convert_plain_inline,
+            "blockquote": self.convert_blockquote,
+            "br": self.convert_br,
+            "code": self.convert_code,
+            "kbd": self.convert_code,
+            "samp": self.convert_code,
+            "div": self.convert_div,
+            "article": self.convert_div,
+            "section": self.convert_div,
+            "dl": self.convert_div,
+            "dd": self.convert_dd,
+            "dt": self.convert_dt,
+            "hr": self.convert_hr,
+            "img": self.convert_img,
+            "video": self.convert_video,
+            "ul": self.convert_list,
+            "ol": self.convert_list,
+            "li": self.convert_li,
+            "p": self.convert_p,
+            "pre": self.convert_pre,
+            "q": self.convert_q,
+            "script": self.convert_empty,
+            "style": self.convert_empty,
+            "table": self.convert_table,
+            "caption": self.convert_caption,
+            "figcaption": self.convert_figcaption,
+            "td": self.convert_cell,
+            "th": self.convert_cell,
+            "tr": self.convert_tr,
+            "[document]": self.convert_document,
+        }
+
+    def process_tag(self, node: Node, parent_tags: frozenset[str]) -> str:
+        name = node.name
+        heading = heading_pattern.match(name)
+        added = {name}
+        if heading or name in ("td", "th"):
+            added.add("_inline")
+        if name in ("pre", "code", "kbd", "samp"):
+            added.add("_noformat")
+        child_tags = parent_tags | added
+
+        strings = []
+        for child in node.children:
+            if self._can_ignore(child, node.block):
+                continue
+            if child.name is None:
+                string = self.process_text(child, child_tags)
+            else:
+                string = self.process_tag(child, child_tags)
+            if string:
+                strings.append(string)
+
+        if name != "pre" and "pre" not in parent_tags:
+            # collapse the newlines between children to at most 2
+            collapsed = [""]
+            for string in strings:
+                leading, content, trailing = _split_newlines(string)
+                if collapsed[-1] and leading:
+                    previous_trailing = collapsed.pop()
+                    leading = "\n" * min(2, max(len(previous_trailing), len(leading)))
+                collapsed += (leading, content, trailing)
+            strings = collapsed
+        text = "".join(strings)
+
+        convert = self.converters.get(node.name)
+        if convert is None and heading:
+            return self.convert_heading(int(heading.group(1)), text, parent_tags)
+        return convert(node, text, parent_tags) if convert else text
+
+    @staticmethod
+    def _can_ignore(node: Node, removes_inside: bool) -> bool:
+        if node.name == comment:
+            return True
+        if node.name is not None or node.text.strip() != "":
+            return False
+        if removes_inside and (node.prev is None or node.next is None):
+            return True
+        return (node.prev is not None and node.prev.spaced) or (
+            node.next is not None and node.next.spaced
+        )
+
+    def process_text(self, node: Node, parent_tags: frozenset[str]) -> str:
+        text = node.text
+        if "pre" not in parent_tags:
+            if "\n" in text or "\r" in text:
+                text = newline_pattern.sub("\n", text)
+            if "\t" in text or "  " in text:
+                text = spaces_pattern.sub(" ", text)
+        if "_noformat" not in parent_tags:
+            if "*" in text:
+                text = text.replace("*", r"\*")
+            if "_" in text:
+                text = text.replace("_", r"\_")
+        prev, next_, parent_block = node.prev, node.next, node.parent.block
+        if prev.spaced if prev is not None else parent_block:
+            text = text.lstrip(" \t\r\n")
+        if next_.spaced if next_ is not None else parent_block:
+            text = text.rstrip()
+        return text
+
+    def convert_document(self, node, text, parent_tags):
+        return text.strip("\n")
+
+    def _inline(self, markup: str, text: str, parent_tags) -> str:
+        if "_noformat" in parent_tags:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        return f"{prefix}{markup}{text}{markup}{suffix}"
+
+    def convert_strong(self, node, text, parent_tags):
+        return self._inline("**", text, parent_tags)
+
+    def convert_em(self, node, text, parent_tags):
+        return self._inline("*", text, parent_tags)
+
+    def convert_del(self, node, text, parent_tags):
+        return self._inline("~~", text, parent_tags)
+
+    def convert_plain_inline(self, node, text, parent_tags):
+        return self._inline("", text, parent_tags)
+
+    def convert_empty(self, node, text, parent_tags):
+        return ""
+
+    def convert_a(self, node, text, parent_tags):
+        if "_noformat" in parent_tags:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        href = node.attrs.get("href")
+        title = node.attrs.get("title")
+        if text.replace(r"\_", "_") == href and not title:
+            return f"<{href}>"
+        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+    def convert_blockquote(self, node, text, parent_tags):
+        text = (text or "").strip(" \t\r\n")
+        if "_inline" in parent_tags:
+            return " " + text + " "
+        if not text:
+            return "\n"
+        text = line_pattern.sub(
+            lambda match: "> " + match.group(1) if match.group(1) else ">", text
+        )
+        return "\n" + text + "\n\n"
+
+    def convert_br(self, node, text, parent_tags):
+        if "_inline" in parent_tags:
+            return text + " " if text else " "
+        return "  \n" + text
+
+    def convert_code(self, node, text, parent_tags):
+        if "_noformat" in parent_tags:
+            return text
+        prefix, suffix, text = _chomp(text)
+        if not text:
+            return ""
+        max_backticks = max(
+            (len(match) for match in backticks_pattern.findall(text)), default=0
+        )
+        delimiter = "`" * (max_backticks + 1)
+        if max_backticks > 0:
+            text = " " + text + " "
+        return f"{prefix}{delimiter}{text}{delimiter}{suffix}"
+
+    def convert_div(self, node, text, parent_tags):
+        if "_inline" in parent_tags:
+            return " " + text.strip() + " "
+        text = text.strip()
+        return f"\n\n{text}\n\n" if text else ""
+
+    def convert_dd(self, node, text, parent_tags):
+        text = (text or "").strip()
+        if "_inline" in parent_tags:
+            return " " + text + " "
+        if not text:
+            return "\n"
+        text = line_pattern.sub(
+            lambda match: "    " + match.group(1) if match.group(1) else "", text
+        )
+        return ":" + text[1:] + "\n"
+
+    def convert_dt(self, node, text, parent_tags):
+        text = whitespace_pattern.sub(" ", (text or "").strip())
+        if "_inline" in parent_tags:
+            return " " + text + " "
+        if not text:
+            return "\n"
+        return f"\n\n{text}\n"
+
+    def convert_heading(self, n: int, text: str, parent_tags) -> str:
+        if "_inline" in parent_tags:
+            return text
+        n = max(1, min(6, n))
+        text = text.strip()
+        if n <= 2:
+            text = text.rstrip()
+            line = ("=" if n == 1 else "-") * len(text)
+            return f"\n\n{text}\n{line}\n\n" if text else ""
+        text = whitespace_pattern.sub(" ", text)
+        return "\n\n%s %s\n\n" % ("#" * n, text)
+
+    def convert_hr(self, node, text, parent_tags):
+        return "\n\n---\n\n"
+
+    def convert_img(self, node, text, parent_tags):
+        alt = node.attrs.get("alt") or ""
+        if "_inline" in parent_tags:
+            return alt
+        src = node.attrs.get("src") or ""
+        title = node.attrs.get("title") or ""
+        title_part = ' "%s"' % title.replace('"', r"\"") if title else ""
+        return f"![{alt}]({src}{title_part})"
+
+    def convert_video(self, node, text, parent_tags):
+        if "_inline" in parent_tags:
+            return text
+        src = node.attrs.get("src") or ""
+        if not src:
+            sources = [
+                source for source in node.find_all(("source",)) if "src" in source.attrs
+            ]
+            if sources:
+                src = sources[0].attrs.get("src") or ""
+        poster = node.attrs.get("poster") or ""
+        if src and poster:
+            return f"[![{text}]({poster})]({src})"
+        if src:
+            return f"[{text}]({src})"
+        if poster:
+            return f"![{text}]({poster})"
+        return text
+
+    def convert_list(self, node, text, parent_tags):
+        next_sibling = node.next
+        while next_sibling is not None and not _is_block_content(next_sibling):
+            next_sibling = next_sibling.next
+        before_paragraph = next_sibling is not None and next_sibling.name not in (
+            "ul",
+            "ol",
+        )
+        if "li" in parent_tags:
+            return "\n" + text.rstrip()
+        return "\n\n" + text + ("\n" if before_paragraph else "")
+
+    def convert_li(self, node, text, parent_tags):
+        text = (text or "").strip()
+        if not text:
+            return "\n"
+        parent = node.parent
+        if parent is not None and parent.name == "ol":
+            start = parent.attrs.get("start")
+            start = int(start) if start and start.isnumeric() else 1
+            bullet = "%s." % (start + sum(1 for _ in node.previous_tags("li")))
+        else:
+            depth = -1
+            ancestor = node
+            while ancestor is not None:
+                if ancestor.name == "ul":
+                    depth += 1
+                ancestor = ancestor.parent
+            bullet = "*+-"[depth % 3]
+        bullet += " "
+        indent = " " * len(bullet)
+        text = line_pattern.sub(
+            lambda match: indent + match.group(1) if match.group(1) else "", text
+        )
+        return bullet + text[len(bullet) :] + "\n"
+
+    def convert_p(self, node, text, parent_tags):
+        if "_inline" in parent_tags:
+            return " " + text.strip(" \t\r\n") + " "
+        text = text.strip(" \t\r\n")
+        return f"\n\n{text}\n\n" if text else ""
+
+    def convert_pre(self, node, text, parent_tags):
+        if not text:
+            return ""
+        text = pre_rstrip_pattern.sub("", pre_lstrip_pattern.sub("", text))
+        return f"\n\n```\n{text}\n```\n\n"
+
+    def convert_q(self, node, text, parent_tags):
+        return '"' + text + '"'
+
+    def convert_table(self, node, text, parent_tags):
+        return "\n\n" + text.strip() + "\n\n"
+
+    def convert_caption(self, node, text, parent_tags):
+        return text.strip() + "\n\n"
+
+    def convert_figcaption(self, node, text, parent_tags):
+        return "\n\n" + text.strip() + "\n\n"
+
+    def convert_cell(self, node, text, parent_tags):
+        return " " + text.strip().replace("\n", " ") + " |" * _colspan(node)
+
+    def convert_tr(self, node, text, parent_tags):
+        cells = node.find_all(("td", "th"))
+        parent = node.parent
+        is_first_row = next(node.previous_tags(), None) is None
+        is_head_row = all(cell.name == "th" for cell in cells) or (
+            parent.name == "thead" and len(parent.find_all(("tr",))) == 1
+        )
+        is_head_row_missing = (is_first_row and parent.name != "tbody") or (
+            is_first_row
+            and parent.name == "tbody"
+            and len(parent.parent.find_all(("thead",))) < 1
+        )
+        full_colspan = sum(_colspan(cell) for cell in cells)
+        overline = underline = ""
+        if is_head_row and is_first_row:
+            underline = "| " + " | ".join(["---"] * full_colspan) + " |\n"
+        elif is_head_row_missing or (
+            is_first_row
+            and (
+                parent.name == "table"
+                or (
+                    parent.name == "tbody"
+                    and next(parent.previous_tags(), None) is None
+                )
+            )
+        ):
+            overline = "| " + " | ".join([""] * full_colspan) + " |\n"
+            overline += "| " + " | ".join(["---"] * full_colspan) + " |\n"
+        return overline + "|" + text + "\n" + underline
+
+
+writer = MarkdownWriter()
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import JobPost, Location
+
+# spellings folded together before comparing titles
+title_abbreviations = {
+    "sr": "senior",
+    "jr": "junior",
+    "mgr": "manager",
+    "eng": "engineer",
+    "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer",
+}
+# legal suffixes dropped from company names
+company_suffixes = {
+    "inc",
+    "incorporated",
+    "llc",
+    "ltd",
+    "limited",
+    "corp",
+    "corporation",
+    "co",
+    "company",
+    "plc",
+    "gmbh",
+    "pvt",
+    "private",
+}
+
+tag_pattern = re.compile(r"<[^>]+>")
+word_pattern = re.compile(r"[^\W_]+")
+
+
+def normalize_words(text: str | None) -> list[str]:
+    """
+    :return: lowercase words of text, without HTML tags, punctuation or markdown
+    """
+    if not isinstance(text, str):
+        return []
+    return word_pattern.findall(tag_pattern.sub(" ", text).lower())
+
+
+def title_words(title: str | None) -> list[str]:
+    words = []
+    for word in normalize_words(title):
+        words.extend(title_abbreviations.get(word, word).split())
+    return words
+
+
+def company_key(company: str | None) -> str:
+    """
+    :return: normalized company name, empty if missing
+    """
+    words = [word for word in normalize_words(company) if word not in company_suffixes]
+    return "" if words == ["n", "a"] else " ".join(words)
+
+
+def fingerprint(
+    title: str | None, company: str | None, location: Location | str | None
+) -> str | None:
+    """
+    Key of a job's normalized title, company and city, equal for the same posting
+    on different sites. location is a Location or a display string like
+    "Austin, TX, USA", of which only the city is kept
+    :return: None if the title or company is missing
+    """
+    words = title_words(title)
+    company_name = company_key(company)
+    if not words or not company_name:
+        return None
+    if isinstance(location, Location):
+        city = location.city
+    else:
+        city = location.split(",")[0] if isinstance(location, str) else None
+    key = "|".join((" ".join(words), company_name, " ".join(normalize_words(city))))
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+@lru_cache(maxsize=65536)
+def word_hash(word: str) -> int:
+    return int.from_bytes(hashlib.blake2b(word.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(words: list[str], shingle_size: int = 3) -> int:
+    """
+    64 bit SimHash of the word shingles of a text, near-identical texts differ
+    in only a few bits. Shingle hashes are combined from cached word hashes and
+    mixed with the splitmix64 finalizer in numpy
+    """
+    if not words:
+        return 0
+    hashes = np.fromiter((word_hash(word) for word in words), np.uint64, len(words))
+    size = min(shingle_size, len(hashes))
+    shingles = np.zeros(len(hashes) - size + 1, dtype=np.uint64)
+    for i in range(size):
+        shingles = (shingles * np.uint64(0x100000001B3)) ^ hashes[
+            i : len(hashes) - size + 1 + i
+        ]
+    shingles = np.unique(shingles)
+    shingles ^= shingles >> np.uint64(30)
+    shingles *= np.uint64(0xBF58476D1CE4E5B9)
+    shingles ^= shingles >> np.uint64(27)
+    shingles *= np.uint64(0x94D049BB133111EB)
+    shingles ^= shingles >> np.uint64(31)
+    bits = np.unpackbits(shingles.astype(">u8").view(np.uint8)).reshape(-1, 64)
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
+class DedupIndex:
+    """
+    Finds jobs already added to the index that are the same posting: same
+    normalized title, company and city, or same company, overlapping titles and
+    descriptions whose SimHashes differ in at most max_distance bits (which
+    covers the same posting with a reworded title or location on another site).
+    The hashes are split into max_distance + 1 bands, so any two within
+    max_distance share a band. Bands are bucketed by company and band value, so
+    a lookup only compares the same company's hashes in the job's bands, and
+    stays fast however many companies the index holds. Thread safe, to be
+    shared by the scrapers of all sites.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 6,
+        min_words: int = 30,
+        min_title_overlap: float = 0.8,
+    ):
+        """
+        :param max_distance: bits two description hashes may differ in
+        :param min_words: descriptions shorter than this are not compared
+        :param min_title_overlap: share of the shorter title's words two jobs
+        with near-duplicate descriptions need in common
+        """
+        self.max_distance = max_distance
+        self.min_words = min_words
+        self.min_title_overlap = min_title_overlap
+        self.band_count = max_distance + 1
+        self.band_bits = 64 // self.band_count
+        self.lock = threading.Lock()
+        self.fingerprints: dict[str, str] = {}
+        # per band, by (company key, band value): (hash, job id, title words)
+        self.bands: list[dict[tuple[str, int], list[tuple[int, str, frozenset]]]] = [
+            {} for _ in range(self.band_count)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def _band_keys(self, hash_: int, company_name: str) -> list[tuple[str, int]]:
+        mask = (1 << self.band_bits) - 1
+        return [
+            (company_name, (hash_ >> (i * self.band_bits)) & mask)
+            for i in range(self.band_count)
+        ]
+
+    def seen(
+        self, title: str | None, company: str | None, location: Location | str | None
+    ) -> bool:
+        """
+        :return: whether a job with the same title, company and city was added,
+        checked by scrapers before fetching a job's details
+        """
+        key = fingerprint(title, company, location)
+        return key is not None and key in self.fingerprints
+
+    def add(
+        self,
+        job_id: str,
+        title: str | None,
+        company: str | None,
+        location: Location | str | None,
+        description: str | None = None,
+    ) -> str | None:
+        """
+        Adds a job unless it duplicates one already added
+        :return: id of the job it duplicates, None if it was added
+        """
+        key = fingerprint(title, company, location)
+        words = normalize_words(description)
+        company_name = company_key(company)
+        titles = frozenset(title_words(title))
+        hash_ = (
+            simhash(words) if len(words) >= self.min_words and company_name else None
+        )
+        with self.lock:
+            duplicate_of = self.fingerprints.get(key) if key is not None else None
+            if duplicate_of is not None:
+                return duplicate_of
+            if hash_ is not None:
+                band_keys = self._band_keys(hash_, company_name)
+                for band, band_key in zip(self.bands, band_keys):
+                    for other in band.get(band_key, ()):
+                        if self._same_posting(hash_, titles, other):
+                            return other[1]
+                entry = (hash_, job_id, titles)
+                for band, band_key in zip(self.bands, band_keys):
+                    band.setdefault(band_key, []).append(entry)
+            if key is not None:
+                self.fingerprints[key] = job_id
+        return None
+
+    def _same_posting(self, hash_: int, titles: frozenset, other: tuple) -> bool:
+        other_hash, _, other_titles = other
+        if (hash_ ^ other_hash).bit_count() > self.max_distance:
+            return False
+        shorter = min(len(titles), len(other_titles))
+        overlap = len(titles & other_titles) / max(shorter, 1)
+        return overlap >= self.min_title_overlap
+
+    def add_job(self, job: JobPost) -> str | None:
+        return self.add(
+            job.id or job.job_url,
+            job.title,
+            job.company_name,
+            job.location,
+            job.description,
+        )
+
+
+def find_duplicates(
+    jobs: pd.DataFrame, max_distance: int = 6, index: DedupIndex | None = None
+) -> pd.Series:
+    """
+    Finds the near-duplicate postings of a DataFrame of scrape_jobs results,
+    e.g. an archive aggregated over many runs. Rows are compared in order, the
+    first of each group is kept
+    :param index: index to compare against and add to, a new one by default
+    :return: Series aligned with jobs holding, for each duplicate, the id of the
+    earlier job it duplicates, None for the others. Drop the duplicates with
+    jobs[find_duplicates(jobs).isna()]
+    """
+    index = index if index is not None else DedupIndex(max_distance=max_distance)
+    duplicate_of = [
+        index.add(
+            job_id if isinstance(job_id, str) else job_url,
+            title,
+            company,
+            location,
+            description if isinstance(description, str) else None,
+        )
+        for job_id, job_url, title, company, location, description in zip(
+            jobs["id"],
+            jobs["job_url"],
+            jobs["title"],
+            jobs["company"],
+            jobs["location"],
+            jobs["description"],
+        )
+    ]
+    return pd.Series(duplicate_of, index=jobs.index, dtype=object)
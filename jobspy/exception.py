@@ -42,4 +42,9 @@ class NaukriException(Exception):
 
 class BDJobsException(Exception):
     def __init__(self, message=None):
-        super().__init__(message or "An error occurred with BDJobs")
\ No newline at end of file
+        super().__init__(message or "An error occurred with BDJobs")
+
+
+class DeadlineExceeded(TimeoutError):
+    def __init__(self, message=None):
+        super().__init__(message or "The scrape's time budget ran out")
@@ -3,9 +3,10 @@ from __future__ import annotations
 import re
 import json
 import requests
-from typing import Tuple
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
@@ -18,8 +19,9 @@ from jobspy.util import (
     create_logger,
     create_session,
     markdown_converter,
+    rate_limiter,
 )
-from jobspy.exception import GlassdoorException
+from jobspy.exception import DeadlineExceeded, GlassdoorException
 from jobspy.model import (
     JobPost,
     JobResponse,
@@ -27,6 +29,7 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
+    Pause,
 )
 
 log = create_logger("Glassdoor")
@@ -48,7 +51,9 @@ class Glassdoor(Scraper):
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
+        self.max_blocked_retries = 3
         self.seen_urls = set()
+        self.locations = {}
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -56,26 +61,29 @@ class Glassdoor(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields Glassdoor jobs with scraper_input criteria as each page is parsed.
+        :param scraper_input: Information about job search criteria.
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-        self.base_url = self.scraper_input.country.get_glassdoor_url()
-
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        if self.user_agent:
-            headers["user-agent"] = self.user_agent
-        self.session.headers.update(headers)
+        self.seen_urls = set()
+        self._start_session(self.scraper_input.country.get_glassdoor_url())
 
-        location_id, location_type = self._get_location(
-            scraper_input.location, scraper_input.is_remote
-        )
+        location_key = (scraper_input.location, scraper_input.is_remote)
+        location_id, location_type = self.locations.get(
+            location_key
+        ) or self._get_location(*location_key)
         if location_type is None:
             log.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+            self.failed = True
+            return
+        self.locations[location_key] = location_id, location_type
+        job_count = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
@@ -83,18 +91,53 @@ class Glassdoor(Scraper):
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
             log.info(f"search page: {page} / {range_end - 1}")
-            try:
-                jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
-                )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
+            for attempt in range(self.max_blocked_retries + 1):
+                try:
+                    jobs, next_cursor = self._fetch_jobs_page(
+                        scraper_input, location_id, location_type, page, cursor
+                    )
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    log.error(f"Glassdoor: {str(e)}")
+                    self.failed = True
+                    return
+                if jobs is not None:
                     break
-            except Exception as e:
-                log.error(f"Glassdoor: {str(e)}")
+                log.warning(f"429 Response - backing off before retrying page {page}")
+                yield rate_limiter.pause(f"{self.base_url}/graph")
+            if jobs is None:
+                log.error("Glassdoor: 429 Response - blocked for too many requests")
+                self.failed = True
+                return
+            cursor = next_cursor
+            jobs = jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs)
+            yield from jobs
+            if not jobs or job_count >= scraper_input.results_wanted:
                 break
-        return JobResponse(jobs=job_list)
+
+    def _start_session(self, base_url: str):
+        """
+        Creates the session and csrf token, which are reused across searches on
+        the same domain
+        """
+        if self.session is not None and base_url == self.base_url:
+            return
+        self.base_url = base_url
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+        )
+        token = self._get_csrf_token()
+        headers["gd-csrf-token"] = token if token else fallback_token
+        if self.user_agent:
+            headers["user-agent"] = self.user_agent
+        self.session.headers.update(headers)
+        self.locations = {}
+
+    def fetch_details(self, job_id: str, job_url: str) -> dict:
+        self._start_session(job_url.split("job-listing/")[0])
+        return {"description": self._fetch_job_description(job_id.removeprefix("gd-"))}
 
     def _fetch_jobs_page(
         self,
@@ -103,9 +146,10 @@ class Glassdoor(Scraper):
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> Tuple[list[JobPost], str | None]:
+    ) -> Tuple[list[JobPost] | None, str | None]:
         """
-        Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        Scrapes a page of Glassdoor for jobs with scraper_input criteria.
+        Jobs are None when the page was rate limited (429) and can be retried
         """
         jobs = []
         self.scraper_input = scraper_input
@@ -116,12 +160,16 @@ class Glassdoor(Scraper):
                 timeout_seconds=15,
                 data=payload,
             )
+            if response.status_code == 429:
+                return None, cursor
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
             res_json = response.json()[0]
             if "errors" in res_json:
                 raise ValueError("Error encountered in API response")
+        except DeadlineExceeded:
+            raise
         except (
             requests.exceptions.ReadTimeout,
             GlassdoorException,
@@ -129,19 +177,23 @@ class Glassdoor(Scraper):
             Exception,
         ) as e:
             log.error(f"Glassdoor: {str(e)}")
+            self.failed = True
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
+                executor.submit(copy_context().run, self._process_job, job): job
+                for job in jobs_data
             }
             for future in as_completed(future_to_job_data):
                 try:
                     job_post = future.result()
                     if job_post:
                         jobs.append(job_post)
+                except DeadlineExceeded:
+                    raise
                 except Exception as exc:
                     raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
@@ -186,11 +238,17 @@ class Glassdoor(Scraper):
         else:
             location = parse_location(location_name)
 
+        if self.is_duplicate(title, company_name, location):
+            return None
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = None
+        if not self.scraper_input.defer_descriptions and not self.is_known(job_url):
+            try:
+                description = self._fetch_job_description(job_id)
+            except DeadlineExceeded:
+                raise
+            except:
+                description = None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -246,7 +304,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, timeout_seconds=10)
         if res.status_code != 200:
             return None
         data = res.json()[0]
@@ -3,9 +3,10 @@ from __future__ import annotations
 import math
 import re
 import json
-from typing import Tuple
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
 
+from jobspy.exception import DeadlineExceeded
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
 from jobspy.model import (
     Scraper,
@@ -15,8 +16,9 @@ from jobspy.model import (
     JobResponse,
     Location,
     JobType,
+    Pause,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.util import extract_emails_from_text, classify_job_text, create_session
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
@@ -44,18 +46,41 @@ class Google(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields Google jobs with scraper_input criteria as each page is parsed.
+        :param scraper_input: Information about job search criteria.
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        self.seen_urls = set()
+        job_index = 0
+        job_limit = scraper_input.offset + scraper_input.results_wanted
+
+        def in_window(jobs: list[JobPost]) -> Iterator[JobPost]:
+            nonlocal job_index
+            for job in jobs:
+                if job_index >= job_limit:
+                    return
+                if job_index >= scraper_input.offset:
+                    yield job
+                job_index += 1
+
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            )
+        forward_cursor, jobs = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
             )
-            return JobResponse(jobs=job_list)
+            yield from jobs
+            return
+        yield from in_window(jobs)
 
         page = 1
 
@@ -68,20 +93,17 @@ class Google(Scraper):
             )
             try:
                 jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 log.error(f"failed to get jobs on page: {page}, {e}")
+                self.failed = True
                 break
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            yield from in_window(jobs)
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
@@ -184,6 +206,7 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        is_remote, job_type = classify_job_text(description)
 
         job_post = JobPost(
             id=f"go-{job_info[28]}",
@@ -194,9 +217,9 @@ class Google(Scraper):
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=is_remote,
             description=description,
             emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            job_type=job_type,
         )
         return job_post
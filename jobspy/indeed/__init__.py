@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Tuple
+from typing import Iterator, Tuple
 
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
@@ -15,6 +15,7 @@ from jobspy.model import (
     JobResponse,
     JobType,
     DescriptionFormat,
+    Pause,
 )
 from jobspy.util import (
     extract_emails_from_text,
@@ -53,12 +54,22 @@ class Indeed(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields Indeed jobs with scraper_input criteria as each page is parsed
+        :param scraper_input:
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
+        self.seen_urls = set()
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
+        job_index = 0
+        job_limit = scraper_input.offset + scraper_input.results_wanted
         page = 1
 
         cursor = None
@@ -71,14 +82,13 @@ class Indeed(Scraper):
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            for job in jobs:
+                if job_index >= scraper_input.offset:
+                    yield job
+                job_index += 1
+                if job_index >= job_limit:
+                    return
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
         """
@@ -121,6 +131,7 @@ class Indeed(Scraper):
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
+            self.failed = True
             return jobs, new_cursor
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
@@ -1,5 +1,5 @@
 from jobspy.model import CompensationInterval, JobType, Compensation
-from jobspy.util import get_enum_from_job_type
+from jobspy.util import get_enum_from_job_type, is_remote_text
 
 
 def get_job_type(attributes: list) -> list[JobType]:
@@ -53,19 +53,11 @@ def is_job_remote(job: dict, description: str) -> bool:
     """
     Searches the description, location, and attributes to check if job is remote
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    is_remote_in_attributes = any(
-        any(keyword in attr["label"].lower() for keyword in remote_keywords)
-        for attr in job["attributes"]
+    return is_remote_text(
+        description,
+        job["location"]["formatted"]["long"],
+        *(attr["label"] for attr in job["attributes"]),
     )
-    is_remote_in_description = any(
-        keyword in description.lower() for keyword in remote_keywords
-    )
-    is_remote_in_location = any(
-        keyword in job["location"]["formatted"]["long"].lower()
-        for keyword in remote_keywords
-    )
-    return is_remote_in_attributes or is_remote_in_description or is_remote_in_location
 
 
 def get_compensation_interval(interval: str) -> CompensationInterval:
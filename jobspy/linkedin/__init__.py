@@ -1,17 +1,16 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
+import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 
-from jobspy.exception import LinkedInException
+from jobspy.exception import DeadlineExceeded, LinkedInException
 from jobspy.linkedin.constant import headers
 from jobspy.linkedin.util import (
     is_job_remote,
@@ -30,6 +29,7 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
+    Pause,
 )
 from jobspy.util import (
     extract_emails_from_text,
@@ -39,6 +39,7 @@ from jobspy.util import (
     create_session,
     remove_attributes,
     create_logger,
+    rate_limiter,
 )
 
 log = create_logger("LinkedIn")
@@ -46,9 +47,9 @@ log = create_logger("LinkedIn")
 
 class LinkedIn(Scraper):
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
+    search_url = f"{base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?"
     jobs_per_page = 25
+    max_blocked_retries = 3
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
@@ -76,16 +77,25 @@ class LinkedIn(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields LinkedIn jobs with scraper_input criteria as each page is parsed
+        :param scraper_input:
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
+        blocked_count = 0
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: job_count < scraper_input.results_wanted and start < 1000
         )
         while continue_search():
             request_count += 1
@@ -115,33 +125,51 @@ class LinkedIn(Scraper):
                 params["f_TPR"] = f"r{seconds_old}"
 
             params = {k: v for k, v in params.items() if v is not None}
+            blocked = False
             try:
                 response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
+                    self.search_url,
                     params=params,
                     timeout=10,
                 )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = (
-                            f"429 Response - Blocked by LinkedIn for too many requests"
-                        )
-                    else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
+                blocked = response.status_code == 429
+                if response.status_code not in range(200, 400) and not blocked:
+                    err = f"LinkedIn response status code {response.status_code}"
+                    err += f" - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    self.failed = True
+                    return
+            except requests.exceptions.RetryError:
+                blocked = True
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 if "Proxy responded with" in str(e):
                     log.error(f"LinkedIn: Bad proxy")
                 else:
                     log.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
+                self.failed = True
+                return
+            if blocked:
+                if blocked_count >= self.max_blocked_retries:
+                    log.error(
+                        f"429 Response - Blocked by LinkedIn for too many requests"
+                    )
+                    self.failed = True
+                    return
+                blocked_count += 1
+                log.warning(
+                    f"429 Response - backing off before retrying page {request_count}"
+                )
+                request_count -= 1
+                yield rate_limiter.pause(self.search_url)
+                continue
+            blocked_count = 0
 
             soup = BeautifulSoup(response.text, "html.parser")
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
+                return
 
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
@@ -154,21 +182,30 @@ class LinkedIn(Scraper):
                     seen_ids.add(job_id)
 
                     try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
+                        fetch_desc = (
+                            scraper_input.linkedin_fetch_description
+                            and not scraper_input.defer_descriptions
+                        )
                         job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
+                    except DeadlineExceeded:
+                        raise
                     except Exception as e:
                         raise LinkedInException(str(e))
+                    if job_post:
+                        job_count += 1
+                        yield job_post
+                    if not continue_search():
+                        break
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                yield rate_limiter.pause(self.search_url)
                 start += len(job_cards)
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    def fetch_details(self, job_id: str, job_url: str) -> dict:
+        job_details = self._get_job_details(job_id.removeprefix("li-"))
+        if job_details.get("job_level"):
+            job_details["job_level"] = job_details["job_level"].lower()
+        return job_details
 
     def _process_job(
         self, job_card: Tag, job_id: str, full_descr: bool
@@ -216,8 +253,11 @@ class LinkedIn(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except:
                 date_posted = None
+        if self.is_duplicate(title, company, location):
+            return None
+        job_url = f"{self.base_url}/jobs/view/{job_id}"
         job_details = {}
-        if full_descr:
+        if full_descr and not self.is_known(job_url):
             job_details = self._get_job_details(job_id)
             description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
@@ -230,7 +270,7 @@ class LinkedIn(Scraper):
             location=location,
             is_remote=is_remote,
             date_posted=date_posted,
-            job_url=f"{self.base_url}/jobs/view/{job_id}",
+            job_url=job_url,
             compensation=compensation,
             job_type=job_details.get("job_type"),
             job_level=job_details.get("job_level", "").lower(),
@@ -253,6 +293,8 @@ class LinkedIn(Scraper):
                 f"{self.base_url}/jobs/view/{job_id}", timeout=5
             )
             response.raise_for_status()
+        except DeadlineExceeded:
+            raise
         except:
             return {}
         if "linkedin.com/signup" in response.url:
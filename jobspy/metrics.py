@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from urllib.parse import urlparse
+
+# "scraper" is the time spent in a site's page loop and its pauses, the parse
+# stage reported is what is left of it after the network, wait, convert and
+# validate stages timed within
+stages = ("scraper", "network", "wait", "convert", "validate", "assemble")
+
+
+class SiteMetrics:
+    """
+    Time spent per stage and request counts of one site's scrape. Stages timed
+    in several threads at once (e.g. Glassdoor's description fetches) add up
+    their time, so they can exceed the wall time of the scrape
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stages = dict.fromkeys(stages, 0.0)
+        self.requests = 0
+        self.cached_requests = 0
+        self.bytes = 0
+        self.jobs = 0
+        self.conversions = 0
+        self.cached_conversions = 0
+
+    def add(self, stage: str, seconds: float):
+        with self.lock:
+            self.stages[stage] += seconds
+
+    def add_request(self, response, seconds: float, cached: bool = False):
+        with self.lock:
+            if cached:
+                self.cached_requests += 1
+            else:
+                self.requests += 1
+                self.stages["network"] += seconds
+            self.bytes += len(response.content or b"")
+
+    def add_conversion(self, cached: bool):
+        with self.lock:
+            self.conversions += 1
+            if cached:
+                self.cached_conversions += 1
+
+    def to_dict(self) -> dict:
+        scraper_stages = ("network", "wait", "convert", "validate")
+        seconds = self.stages["scraper"]
+        parse = seconds - sum(self.stages[stage] for stage in scraper_stages)
+        return {
+            "seconds": seconds,
+            **{stage: self.stages[stage] for stage in scraper_stages},
+            "parse": max(parse, 0.0),
+            "assemble": self.stages["assemble"],
+            "requests": self.requests,
+            "cached_requests": self.cached_requests,
+            "bytes": self.bytes,
+            "jobs": self.jobs,
+            "conversions": self.conversions,
+            "cached_conversions": self.cached_conversions,
+            "conversion_hit_rate": (
+                self.cached_conversions / self.conversions if self.conversions else None
+            ),
+        }
+
+
+class ScrapeMetrics:
+    """
+    Per-site timings of a scrape_jobs run, filled in by the scrapers and sessions
+    running in a context where track_site() made a site current
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+        self.sites: dict[str, SiteMetrics] = {}
+        # stages done once for all sites after scraping
+        self.stages = {"convert": 0.0, "assemble": 0.0}
+
+    def site(self, site: str) -> SiteMetrics:
+        with self.lock:
+            return self.sites.setdefault(site, SiteMetrics())
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self.started
+
+    def to_dict(self) -> dict:
+        return {
+            "seconds": self.seconds,
+            **self.stages,
+            "sites": {site: m.to_dict() for site, m in self.sites.items()},
+        }
+
+
+# metrics of the site whose scrape runs in this context
+current_site: ContextVar[SiteMetrics | None] = ContextVar("current_site", default=None)
+
+
+@contextmanager
+def track_site(metrics: ScrapeMetrics | None, site: str) -> Iterator[None]:
+    """
+    Makes site's metrics current for the code run in the block
+    """
+    if metrics is None:
+        yield
+        return
+    token = current_site.set(metrics.site(site))
+    try:
+        yield
+    finally:
+        current_site.reset(token)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """
+    Adds the time spent in the block to stage of the current site, if any
+    """
+    site_metrics = current_site.get()
+    if site_metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        site_metrics.add(stage, time.perf_counter() - start)
+
+
+def record_request(response, seconds: float, cached: bool = False):
+    site_metrics = current_site.get()
+    if site_metrics is not None:
+        site_metrics.add_request(response, seconds, cached)
+
+
+def record_conversion(cached: bool):
+    """
+    Counts a description conversion of the current site, if any, and whether the
+    conversion cache served it
+    """
+    site_metrics = current_site.get()
+    if site_metrics is not None:
+        site_metrics.add_conversion(cached)
+
+
+# upper bounds in seconds of the request latency histogram buckets
+default_latency_buckets = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def endpoint_labels(url: str) -> tuple[str, str]:
+    """
+    :return: host and path of url, with path segments holding ids (4 or more
+    digits in a row) replaced by {id} so that job pages share one endpoint
+    """
+    parsed = urlparse(url)
+    segments = [
+        "{id}" if re.search(r"\d{4}", segment) else segment
+        for segment in parsed.path.split("/")
+    ]
+    return parsed.hostname or "", "/".join(segments) or "/"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    In-process registry of the sessions' requests per host and endpoint: latency
+    histograms, responses by status code, urllib3 retries and response bytes.
+    Installed with jobspy.util.set_metrics_registry, it is exported in the
+    Prometheus text format by export(), and written to path (e.g. for the
+    node_exporter textfile collector) by save() at the end of each scrape
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        buckets: tuple[float, ...] = default_latency_buckets,
+    ):
+        self.path = path
+        self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        # per (host, endpoint): request count of each bucket, the last is +Inf
+        self.latency_counts: dict[tuple[str, str], list[int]] = {}
+        self.latency_sums: dict[tuple[str, str], float] = defaultdict(float)
+        self.responses: dict[tuple[str, str, str], int] = defaultdict(int)
+        self.retries: dict[tuple[str, str], int] = defaultdict(int)
+        self.bytes: dict[tuple[str, str], int] = defaultdict(int)
+
+    def observe(
+        self, url: str, status: str, seconds: float, size: int = 0, retries: int = 0
+    ):
+        """
+        Records a request to url that ended with status (a status code, or
+        "timeout" / "error" when no response came back) after seconds
+        """
+        key = endpoint_labels(url)
+        with self.lock:
+            counts = self.latency_counts.get(key)
+            if counts is None:
+                counts = self.latency_counts[key] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, seconds)] += 1
+            self.latency_sums[key] += seconds
+            self.responses[(*key, status)] += 1
+            self.retries[key] += retries
+            self.bytes[key] += size
+
+    def export(self) -> str:
+        """
+        :return: the metrics in the Prometheus text exposition format
+        """
+        lines = [
+            "# HELP jobspy_request_duration_seconds Latency of requests.",
+            "# TYPE jobspy_request_duration_seconds histogram",
+        ]
+        with self.lock:
+            for (host, endpoint), counts in sorted(self.latency_counts.items()):
+                labels = f'host="{_escape(host)}",endpoint="{_escape(endpoint)}"'
+                total = 0
+                for bound, count in zip((*self.buckets, "+Inf"), counts):
+                    total += count
+                    lines.append(
+                        f"jobspy_request_duration_seconds_bucket"
+                        f'{{{labels},le="{bound}"}} {total}'
+                    )
+                sum_ = self.latency_sums[(host, endpoint)]
+                lines.append(f"jobspy_request_duration_seconds_sum{{{labels}}} {sum_}")
+                lines.append(
+                    f"jobspy_request_duration_seconds_count{{{labels}}} {total}"
+                )
+            lines += [
+                "# HELP jobspy_responses_total Requests by response status.",
+                "# TYPE jobspy_responses_total counter",
+            ]
+            for (host, endpoint, status), count in sorted(self.responses.items()):
+                lines.append(
+                    f'jobspy_responses_total{{host="{_escape(host)}",'
+                    f'endpoint="{_escape(endpoint)}",status="{status}"}} {count}'
+                )
+            for name, help_text, values in (
+                ("request_retries", "Retries made by the sessions.", self.retries),
+                ("response_bytes", "Bytes of response bodies.", self.bytes),
+            ):
+                lines += [
+                    f"# HELP jobspy_{name}_total {help_text}",
+                    f"# TYPE jobspy_{name}_total counter",
+                ]
+                for (host, endpoint), value in sorted(values.items()):
+                    lines.append(
+                        f'jobspy_{name}_total{{host="{_escape(host)}",'
+                        f'endpoint="{_escape(endpoint)}"}} {value}'
+                    )
+        return "\n".join(lines) + "\n"
+
+    def save(self):
+        """
+        Writes export() to path, if any
+        """
+        if not self.path:
+            return
+        text = self.export()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        with self.lock:
+            self.latency_counts.clear()
+            self.latency_sums.clear()
+            self.responses.clear()
+            self.retries.clear()
+            self.bytes.clear()
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, AsyncIterator, Container, Iterator, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy.exception import DeadlineExceeded
+from jobspy.metrics import current_site, timed
+
+if TYPE_CHECKING:
+    from jobspy.dedup import DedupIndex
+    from jobspy.util import TokenBucket
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -168,16 +178,24 @@ class Country(Enum):
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        country = country_by_name.get(country_str)
+        if country is not None:
+            return country
         valid_countries = [country.value for country in cls]
         raise ValueError(
             f"Invalid country string: '{country_str}'. Valid countries are: {', '.join([country[0] for country in valid_countries])}"
         )
 
 
+# Country of each of the comma separated names in its value, built once for
+# from_string. Iterated in reverse so the first country with a name wins
+country_by_name: dict[str, Country] = {
+    name: country
+    for country in reversed(Country)
+    for name in country.value[0].split(",")
+}
+
+
 class Location(BaseModel):
     country: Country | str | None = None
     city: Optional[str] = None
@@ -280,6 +298,13 @@ class JobPost(BaseModel):
     vacancy_count: int | None = None  #from vacancy
     work_from_home_type: str | None = None  #from clusters.wfhType (e.g., "Hybrid", "Remote")
 
+    def __init__(self, **data):
+        if current_site.get() is None:
+            super().__init__(**data)
+            return
+        with timed("validate"):
+            super().__init__(**data)
+
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
 
@@ -300,6 +325,42 @@ class SalarySource(Enum):
     DESCRIPTION = "description"
 
 
+class Pause(float):
+    """
+    Seconds a scraper's page loop waits before its next request, with the token
+    bucket that request is paced by if any
+    """
+
+    def __new__(cls, seconds: float, bucket: TokenBucket | None = None):
+        pause = super().__new__(cls, seconds)
+        pause.bucket = bucket
+        return pause
+
+
+# time.monotonic() by which the scrape running in this context has to finish,
+# read by the sessions to clamp request timeouts
+request_deadline: ContextVar[float | None] = ContextVar(
+    "request_deadline", default=None
+)
+
+# token bucket scrape_aiter already took a token from, while awaiting a Pause, for
+# the next request of the scrape running in this context, so that the session
+# sends it without waiting again
+reserved_bucket: ContextVar[TokenBucket | None] = ContextVar(
+    "reserved_bucket", default=None
+)
+
+# index of the jobs scraped so far when the scrape running in this context drops
+# near-duplicate postings, read by the scrapers to skip fetching their details
+dedup_index: ContextVar[DedupIndex | None] = ContextVar("dedup_index", default=None)
+
+# job urls earlier runs of an incremental scrape already returned for the site
+# scraped in this context, read by the scrapers to skip fetching their details
+known_job_urls: ContextVar[Container[str] | None] = ContextVar(
+    "known_job_urls", default=None
+)
+
+
 class ScraperInput(BaseModel):
     site_type: list[Site]
     search_term: str | None = None
@@ -313,6 +374,7 @@ class ScraperInput(BaseModel):
     easy_apply: bool | None = None
     offset: int = 0
     linkedin_fetch_description: bool = False
+    defer_descriptions: bool = False
     linkedin_company_ids: list[int] | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
@@ -330,6 +392,137 @@ class Scraper(ABC):
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.deadline_reached = False
+        # set by paginate when it stops on an error rather than at the end of
+        # the results, so the jobs yielded are not the full search
+        self.failed = False
+        self.completed = False
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Page loop of the scraper, yielding jobs as each page is parsed and a Pause
+        wherever it waits between requests. Scrapers that only implement scrape()
+        yield their jobs once the full response is materialized
+        """
+        yield from self.scrape(scraper_input).jobs
+
+    def fetch_details(self, job_id: str, job_url: str) -> dict:
+        """
+        Fetches the description and other details of a job page for a job scraped
+        with defer_descriptions. self.scraper_input gives the description format
+        :return: dict of the fetched JobPost fields, empty if the site has none
+        """
+        return {}
+
+    def is_duplicate(
+        self, title: str | None, company: str | None, location: Location | None
+    ) -> bool:
+        """
+        :return: whether a job with the same title, company and city was already
+        scraped when duplicates are dropped, so its details need not be fetched
+        """
+        index = dedup_index.get()
+        return index is not None and index.seen(title, company, location)
+
+    def is_known(self, job_url: str) -> bool:
+        """
+        :return: whether an earlier run of an incremental scrape returned the job,
+        so its details need not be fetched again
+        """
+        known = known_job_urls.get()
+        return known is not None and job_url in known
+
+    def scrape_iter(
+        self, scraper_input: ScraperInput, deadline: float | None = None
+    ) -> Iterator[JobPost]:
+        """
+        Yields jobs as each page is parsed, sleeping through the scraper's pauses.
+        Stops once time.monotonic() passes deadline, keeping the jobs yielded so far
+        and setting deadline_reached. completed is set if paginate ran out without
+        failing
+        """
+        self.deadline_reached = self.failed = self.completed = False
+        pages = self.paginate(scraper_input)
+        try:
+            while True:
+                token = request_deadline.set(deadline)
+                try:
+                    with timed("scraper"):
+                        item = next(pages, None)
+                except DeadlineExceeded:
+                    self.deadline_reached = True
+                    return
+                finally:
+                    request_deadline.reset(token)
+                if item is None:
+                    self.completed = not self.failed
+                    return
+                if isinstance(item, Pause):
+                    if deadline is not None and time.monotonic() + item >= deadline:
+                        self.deadline_reached = True
+                        return
+                    with timed("scraper"), timed("wait"):
+                        time.sleep(item)
+                else:
+                    yield item
+        finally:
+            pages.close()
+
+    async def scrape_aiter(
+        self, scraper_input: ScraperInput, deadline: float | None = None
+    ) -> AsyncIterator[JobPost]:
+        """
+        Async variant of scrape_iter. Each blocking page step runs in the event
+        loop's default executor. Pauses are awaited, taking the rate limiter
+        token of the request that follows them, so no thread is held while the
+        scraper waits between pages. The first request of a search and those a
+        step sends after the first (e.g. job detail pages) still wait for their
+        tokens in the worker thread
+        """
+        self.deadline_reached = self.failed = self.completed = False
+        pages = self.paginate(scraper_input)
+        reserved = None
+        try:
+            while True:
+                token = request_deadline.set(deadline)
+                reserved_token = reserved_bucket.set(reserved)
+                try:
+                    with timed("scraper"):
+                        item = await asyncio.to_thread(next, pages, None)
+                except DeadlineExceeded:
+                    self.deadline_reached = True
+                    return
+                finally:
+                    reserved_bucket.reset(reserved_token)
+                    request_deadline.reset(token)
+                reserved = None
+                if item is None:
+                    self.completed = not self.failed
+                    return
+                if isinstance(item, Pause):
+                    wait = item
+                    if item.bucket is not None:
+                        wait, reserved = item.bucket.reserve(), item.bucket
+                    if deadline is not None and time.monotonic() + wait >= deadline:
+                        self.deadline_reached = True
+                        return
+                    with timed("scraper"), timed("wait"):
+                        await asyncio.sleep(wait)
+                else:
+                    yield item
+        finally:
+            try:
+                pages.close()
+            except ValueError:
+                # still running in a worker thread after cancellation
+                pass
+
+    async def scrape_async(
+        self, scraper_input: ScraperInput, deadline: float | None = None
+    ) -> JobResponse:
+        return JobResponse(
+            jobs=[job async for job in self.scrape_aiter(scraper_input, deadline)]
+        )
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 
 import regex as re
 import requests
 
-from jobspy.exception import NaukriException
+from jobspy.exception import DeadlineExceeded, NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
     is_job_remote,
@@ -26,6 +24,7 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
+    Pause,
 )
 from jobspy.util import (
     extract_emails_from_text,
@@ -33,14 +32,13 @@ from jobspy.util import (
     markdown_converter,
     create_session,
     create_logger,
+    rate_limiter,
 )
 
 log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 20  
 
     def __init__(
@@ -69,8 +67,16 @@ class Naukri(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields Naukri jobs with scraper_input criteria as each page is parsed
+        :param scraper_input:
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
@@ -79,7 +85,7 @@ class Naukri(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: job_count < scraper_input.results_wanted and page <= 50  # Arbitrary limit
         )
 
         while continue_search():
@@ -111,16 +117,20 @@ class Naukri(Scraper):
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    self.failed = True
+                    return
                 data = response.json()
                 job_details = data.get("jobDetails", [])
                 log.info(f"Received {len(job_details)} job entries from API")
                 if not job_details:
                     log.warning("No job details found in API response")
                     break
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
+                self.failed = True
+                return
 
             for job in job_details:
                 job_id = job.get("jobId")
@@ -132,22 +142,23 @@ class Naukri(Scraper):
                 try:
                     fetch_desc = scraper_input.linkedin_fetch_description
                     job_post = self._process_job(job, job_id, fetch_desc)
-                    if job_post:
-                        job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
-                        break
+                except DeadlineExceeded:
+                    raise
                 except Exception as e:
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
+                if job_post:
+                    job_count += 1
+                    log.info(f"Added job: {job_post.title} (ID: {job_id})")
+                    yield job_post
+                if not continue_search():
+                    break
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                yield rate_limiter.pause(self.base_url)
                 page += 1
 
-        job_list = job_list[:scraper_input.results_wanted]
-        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
-        return JobResponse(jobs=job_list)
+        log.info(f"Scraping completed. Total jobs collected: {job_count}")
 
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+from collections import defaultdict, deque
+
+import requests
+
+from jobspy.util import build_response, create_logger, set_http_archive
+
+log = create_logger("Replay")
+
+
+def request_key(method: str, url: str, kwargs: dict) -> str:
+    """
+    Identifies a request by method, url with query params and a hash of its body
+    """
+    full_url = requests.Request("GET", url, params=kwargs.get("params")).prepare().url
+    body = kwargs.get("json") if kwargs.get("json") is not None else kwargs.get("data")
+    if isinstance(body, (dict, list)):
+        body = json.dumps(body, sort_keys=True)
+    if isinstance(body, str):
+        body = body.encode()
+    body_hash = hashlib.sha1(body).hexdigest()[:16] if body else ""
+    return f"{method.upper()} {full_url} {body_hash}"
+
+
+class HttpArchive:
+    """
+    Gzipped JSON lines archive of the responses to every request the sessions
+    make. In "record" mode responses are appended as they arrive, in "replay"
+    mode they are served back without any network access: repeated requests get
+    their recorded responses in order, then the last one again.
+    Used as a context manager it installs itself with set_http_archive:
+
+        with HttpArchive("indeed.jsonl.gz", mode="replay"):
+            jobs = scrape_jobs(site_name="indeed", search_term="nurse")
+    """
+
+    def __init__(self, path: str, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid mode: {mode}, use 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.file = None
+        self.responses: dict[str, deque[dict]] = defaultdict(deque)
+        if self.replaying:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self.responses[entry["key"]].append(entry)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, method: str, url: str, kwargs: dict, response):
+        """
+        Appends a requests or tls_client response to the archive
+        """
+        if self.replaying:
+            return
+        entry = {
+            "key": request_key(method, url, kwargs),
+            "status_code": response.status_code,
+            "url": str(response.url),
+            "headers": dict(response.headers),
+            # tls_client decodes bodies as UTF-8 unless told otherwise
+            "encoding": response.encoding or "utf-8",
+            "content": base64.b64encode(response.content).decode(),
+        }
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self.lock:
+            if self.file is None:
+                self.file = gzip.open(self.path, "wt", encoding="utf-8")
+            self.file.write(line)
+
+    def replay(self, method: str, url: str, kwargs: dict) -> requests.Response:
+        key = request_key(method, url, kwargs)
+        with self.lock:
+            entries = self.responses.get(key)
+            if not entries:
+                log.warning(f"no recorded response for {key}")
+                raise requests.exceptions.ConnectionError(
+                    f"No recorded response for {method.upper()} {url}"
+                )
+            entry = entries.popleft() if len(entries) > 1 else entries[0]
+        return build_response(
+            entry["status_code"],
+            entry["url"],
+            entry["headers"],
+            base64.b64decode(entry["content"]),
+            entry["encoding"],
+        )
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def __enter__(self) -> HttpArchive:
+        set_http_archive(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        set_http_archive(None)
+        self.close()
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatch
 from itertools import cycle
+from typing import TYPE_CHECKING, Callable
+from urllib.parse import urlparse
 
 import numpy as np
+import pandas as pd
 import requests
 import tls_client
 import urllib3
 from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.exception import DeadlineExceeded
+from jobspy.metrics import MetricsRegistry, record_conversion, record_request, timed
+from jobspy.model import (
+    CompensationInterval,
+    DescriptionFormat,
+    JobType,
+    Pause,
+    Site,
+    request_deadline,
+    reserved_bucket,
+)
+
+if TYPE_CHECKING:
+    from jobspy.cache import DescriptionStore, HttpCache
+    from jobspy.replay import HttpArchive
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -29,6 +54,361 @@ def create_logger(name: str):
     return logger
 
 
+def get_cache_dir() -> str:
+    """
+    Directory for state kept between runs, JOBSPY_CACHE_DIR or ~/.cache/jobspy
+    """
+    return os.environ.get("JOBSPY_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "jobspy"
+    )
+
+
+class TokenBucket:
+    """
+    Refills `rate` tokens per second up to `burst`. Callers reserve a token and
+    wait until it is due, so concurrent callers are spaced out instead of
+    competing for the same token.
+    The rate adapts AIMD style between min_rate and max_rate: it grows by a
+    twentieth of the configured rate per healthy response and halves when the
+    site throttles or fails
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+    ):
+        self.rate = rate
+        self.rate_step = rate / 20
+        self.min_rate = min_rate or rate / 8
+        self.max_rate = max_rate or rate * 4
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def speed_up(self):
+        with self.lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def back_off(self):
+        """Halves the rate and drops any saved up burst"""
+        with self.lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available, without taking it"""
+        with self.lock:
+            self._refill()
+            return max(0.0, (1 - self.tokens) / self.rate)
+
+    def reserve(self) -> float:
+        """Takes a token and returns the seconds to wait before using it"""
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self):
+        time.sleep(self.reserve())
+
+
+class RateLimiter:
+    """
+    Token buckets per host, selected by the first glob in `limits` matching the
+    request's host and path (e.g. "*.glassdoor.*/graph"). Hosts matching no
+    pattern are not limited. With a state_path, the rates learned from
+    feedback() are saved there and used as the starting rates of the next run
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] | None = None,
+        state_path: str | None = None,
+    ):
+        self.limits = dict(limits or {})
+        self.state_path = state_path
+        self.saved_rates: dict[str, dict[str, float]] | None = None
+        self.buckets: dict[tuple[str, str], TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def set_limit(self, pattern: str, rate: float, burst: int = 1):
+        """
+        Sets the requests per second and burst size for hosts matching pattern
+        """
+        with self.lock:
+            self.limits[pattern] = (rate, burst)
+            for key in [key for key in self.buckets if key[0] == pattern]:
+                del self.buckets[key]
+            for host_rates in self._load().values():
+                host_rates.pop(pattern, None)
+
+    def set_state_path(self, state_path: str | None):
+        """
+        Saves the learned rates to state_path from now on, restarting every host
+        from the rates saved there
+        """
+        with self.lock:
+            self.state_path = state_path
+            self.saved_rates = None
+            self.buckets.clear()
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        parsed = urlparse(url)
+        target = f"{parsed.hostname}{parsed.path}"
+        with self.lock:
+            for pattern, (rate, burst) in self.limits.items():
+                if fnmatch(target, pattern):
+                    key = (pattern, parsed.hostname)
+                    if key not in self.buckets:
+                        bucket = TokenBucket(rate, burst)
+                        saved_rate = self._load().get(parsed.hostname, {}).get(pattern)
+                        if saved_rate:
+                            bucket.rate = min(
+                                bucket.max_rate, max(bucket.min_rate, saved_rate)
+                            )
+                        self.buckets[key] = bucket
+                    return self.buckets[key]
+        return None
+
+    def feedback(self, url: str, status_code: int | None):
+        """
+        Speeds the host up after a healthy response and backs it off after a 429,
+        a 5xx or no response at all (status_code None)
+        """
+        bucket = self.bucket(url)
+        if not bucket:
+            return
+        if status_code is None or status_code == 429 or status_code >= 500:
+            bucket.back_off()
+        else:
+            bucket.speed_up()
+
+    def _load(self) -> dict[str, dict[str, float]]:
+        if self.saved_rates is None:
+            self.saved_rates = {}
+            if self.state_path and os.path.exists(self.state_path):
+                try:
+                    with open(self.state_path) as f:
+                        self.saved_rates = json.load(f)
+                except (OSError, ValueError):
+                    pass
+        return self.saved_rates
+
+    def save(self):
+        """
+        Writes the current rate of every host to state_path
+        """
+        if not self.state_path:
+            return
+        with self.lock:
+            rates = self._load()
+            for (pattern, host), bucket in self.buckets.items():
+                rates.setdefault(host, {})[pattern] = round(bucket.rate, 4)
+            state = json.dumps(rates, indent=2, sort_keys=True)
+        try:
+            os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(state)
+            os.replace(tmp_path, self.state_path)
+        except OSError:
+            pass
+
+    def wait_time(self, url: str) -> float:
+        bucket = self.bucket(url)
+        if not bucket or reserved_bucket.get() is bucket:
+            return 0.0
+        return bucket.wait_time()
+
+    def pause(self, url: str) -> Pause:
+        """
+        :return: Pause until a request to url may be sent, with its bucket so
+        that scrape_aiter can take the token while awaiting it
+        """
+        bucket = self.bucket(url)
+        return Pause(bucket.wait_time() if bucket else 0.0, bucket)
+
+    def acquire(self, url: str):
+        bucket = self.bucket(url)
+        if not bucket:
+            return
+        if reserved_bucket.get() is bucket:
+            # scrape_aiter took the token while it awaited the pause
+            reserved_bucket.set(None)
+            return
+        bucket.acquire()
+
+
+# requests per second and burst per host (and path) pattern, tuned to each site's
+# tolerance. Detail pages fetched per job are listed separately from search pages
+default_rate_limits = {
+    "www.linkedin.com/jobs-guest/*": (0.2, 2),
+    "www.linkedin.com/jobs/view/*": (2, 5),
+    "api.ziprecruiter.com/jobs-app/jobs": (0.2, 1),
+    "www.ziprecruiter.com/*": (3, 10),
+    "*.glassdoor.*/graph": (5, 10),
+    "www.naukri.com/jobapi/*": (0.2, 2),
+    "jobs.bdjobs.com/jobsearch.asp": (0.3, 1),
+    "jobs.bdjobs.com/*": (2, 5),
+    "www.bayt.com/*": (0.3, 1),
+}
+
+rate_limiter = RateLimiter(default_rate_limits)
+
+
+def set_rate_limit(pattern: str, rate: float, burst: int = 1):
+    """
+    Overrides the shared rate limit for hosts matching pattern, e.g.
+    set_rate_limit("www.linkedin.com/jobs-guest/*", rate=0.5, burst=3)
+    """
+    rate_limiter.set_limit(pattern, rate, burst)
+
+
+def set_pacing_state(path: str | None):
+    """
+    Saves the rates rate_limiter learns to path, a JSON file such as
+    os.path.join(get_cache_dir(), "pacing.json"), at the end of each run and
+    starts the next ones from them, or stops saving with None
+    """
+    rate_limiter.set_state_path(path)
+
+
+def deadline_timeout(timeout: float | None, wait: float = 0.0) -> float | None:
+    """
+    Clamps a request timeout to the time left before the deadline of the scrape
+    running in this context. Raises DeadlineExceeded if it has passed or would
+    pass during a wait of `wait` seconds
+    """
+    deadline = request_deadline.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic() - wait
+    if remaining <= 0:
+        raise DeadlineExceeded()
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def throttled(error: Exception) -> bool:
+    """
+    :return: whether a failed request hints at the site throttling us, so that
+    rate_limiter should back off: it timed out, or urllib3 gave up retrying 429
+    and 5xx responses. Connection and proxy errors say nothing about the site
+    """
+    if isinstance(error, requests.exceptions.RequestException):
+        return isinstance(
+            error, (requests.exceptions.Timeout, requests.exceptions.RetryError)
+        )
+    # tls_client raises with the message of the Go client's error
+    message = str(error).lower()
+    return "timeout" in message and "proxy" not in message
+
+
+# HttpCache serving and storing the GET responses of every session, see
+# set_http_cache
+http_cache = None
+
+
+def set_http_cache(cache: HttpCache | None):
+    """
+    Caches GET responses of all sessions in cache (a jobspy.cache.HttpCache), or
+    stops caching with None
+    """
+    global http_cache
+    http_cache = cache
+
+
+# MetricsRegistry every session reports its requests to, see set_metrics_registry
+metrics_registry = None
+
+
+def set_metrics_registry(registry: MetricsRegistry | None):
+    """
+    Reports the latency, status and size of every request the sessions send to
+    registry (a jobspy.metrics.MetricsRegistry), or stops reporting with None
+    """
+    global metrics_registry
+    metrics_registry = registry
+
+
+def observe_request(url: str, seconds: float, response=None, error=None):
+    """
+    Reports a request that got response, or failed with error, to the
+    metrics_registry if one is set
+    """
+    if metrics_registry is None:
+        return
+    if response is not None:
+        status = str(response.status_code)
+        retries = getattr(getattr(response, "raw", None), "retries", None)
+        retries = len(retries.history) if retries is not None else 0
+        size = len(response.content or b"")
+    else:
+        timeouts = (requests.exceptions.Timeout, TimeoutError)
+        status = "timeout" if isinstance(error, timeouts) else "error"
+        retries = size = 0
+    metrics_registry.observe(url, status, seconds, size, retries)
+
+
+def save_state():
+    """
+    Saves the pacing learned by rate_limiter and the metrics_registry export.
+    A replayed archive sends no requests, so the pacing is left as it was
+    """
+    if http_archive is None or not http_archive.replaying:
+        rate_limiter.save()
+    if metrics_registry is not None:
+        metrics_registry.save()
+
+
+# HttpArchive every session records to or replays from, see set_http_archive
+http_archive = None
+
+
+def set_http_archive(archive: HttpArchive | None):
+    """
+    Records the requests of all sessions to archive (a jobspy.replay.HttpArchive),
+    or serves them from it in replay mode. None goes back to the network
+    """
+    global http_archive
+    http_archive = archive
+
+
+def build_response(
+    status_code: int,
+    url: str,
+    headers: dict,
+    content: bytes,
+    encoding: str | None = None,
+) -> requests.Response:
+    """
+    Builds a requests.Response from stored parts, as served by the HTTP cache
+    and replayed archives
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.encoding = (
+        encoding
+        or requests.utils.get_encoding_from_headers(response.headers)
+        or "utf-8"
+    )
+    response._content = content
+    return response
+
+
 class RotatingProxySession:
     def __init__(self, proxies=None):
         if isinstance(proxies, str):
@@ -51,6 +431,19 @@ class RotatingProxySession:
             return {"http": proxy, "https": proxy}
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
 
+    @staticmethod
+    def from_cache(method: str, url: str, params=None) -> tuple[str | None, object]:
+        """
+        :return: the url of a GET with params if http_cache caches it (else None)
+        and its cached response if there is one
+        """
+        if http_cache is None or method.upper() != "GET":
+            return None, None
+        cache_url = requests.Request("GET", url, params=params).prepare().url
+        if http_cache.ttl(cache_url) is None:
+            return None, None
+        return cache_url, http_cache.get(cache_url)
+
 
 class RequestsRotating(RotatingProxySession, requests.Session):
     def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
@@ -74,16 +467,54 @@ class RequestsRotating(RotatingProxySession, requests.Session):
             self.mount("https://", adapter)
 
     def request(self, method, url, **kwargs):
+        if http_archive is not None and http_archive.replaying:
+            start = time.perf_counter()
+            response = http_archive.replay(method, url, kwargs)
+            record_request(response, time.perf_counter() - start)
+            return response
+        response = self.send_request(method, url, **kwargs)
+        if http_archive is not None:
+            http_archive.record(method, url, kwargs, response)
+        return response
+
+    def send_request(self, method, url, **kwargs):
+        cache_url, cached = self.from_cache(method, url, kwargs.get("params"))
+        if cached is not None:
+            record_request(cached, 0.0, cached=True)
+            return cached
         if self.clear_cookies:
             self.cookies.clear()
 
+        deadline_timeout(None, rate_limiter.wait_time(url))
+        with timed("wait"):
+            rate_limiter.acquire(url)
+        timeout = kwargs.get("timeout")
+        kwargs["timeout"] = deadline_timeout(timeout)
+        # a timeout cut short by the deadline is not the site being slow
+        clamped = kwargs["timeout"] != timeout
+
         if self.proxy_cycle:
             next_proxy = next(self.proxy_cycle)
             if next_proxy["http"] != "http://localhost":
                 self.proxies = next_proxy
             else:
                 self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = requests.Session.request(self, method, url, **kwargs)
+        except Exception as e:
+            observe_request(url, time.perf_counter() - start, error=e)
+            if clamped:
+                deadline_timeout(None)
+            elif throttled(e):
+                rate_limiter.feedback(url, None)
+            raise
+        rate_limiter.feedback(url, response.status_code)
+        record_request(response, time.perf_counter() - start)
+        observe_request(url, time.perf_counter() - start, response)
+        if cache_url and response.status_code == 200:
+            http_cache.put(cache_url, response)
+        return response
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
@@ -91,15 +522,55 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
         RotatingProxySession.__init__(self, proxies=proxies)
         tls_client.Session.__init__(self, random_tls_extension_order=True)
 
-    def execute_request(self, *args, **kwargs):
+    def execute_request(self, method, url, *args, **kwargs):
+        if http_archive is not None and http_archive.replaying:
+            start = time.perf_counter()
+            response = http_archive.replay(method, url, kwargs)
+            record_request(response, time.perf_counter() - start)
+            return response
+        response = self.send_request(method, url, *args, **kwargs)
+        if http_archive is not None:
+            http_archive.record(method, url, kwargs, response)
+        return response
+
+    def send_request(self, method, url, *args, **kwargs):
+        cache_url, cached = self.from_cache(method, url, kwargs.get("params"))
+        if cached is not None:
+            record_request(cached, 0.0, cached=True)
+            return cached
+        deadline_timeout(None, rate_limiter.wait_time(url))
+        with timed("wait"):
+            rate_limiter.acquire(url)
+        clamped = False
+        if request_deadline.get() is not None:
+            key = "timeout" if kwargs.get("timeout") else "timeout_seconds"
+            timeout = kwargs.get(key) or self.timeout_seconds
+            kwargs[key] = deadline_timeout(timeout)
+            clamped = kwargs[key] != timeout
         if self.proxy_cycle:
             next_proxy = next(self.proxy_cycle)
             if next_proxy["http"] != "http://localhost":
                 self.proxies = next_proxy
             else:
                 self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = tls_client.Session.execute_request(
+                self, method, url, *args, **kwargs
+            )
+        except Exception as e:
+            observe_request(url, time.perf_counter() - start, error=e)
+            if clamped:
+                deadline_timeout(None)
+            elif throttled(e):
+                rate_limiter.feedback(url, None)
+            raise
+        rate_limiter.feedback(url, response.status_code)
+        record_request(response, time.perf_counter() - start)
+        observe_request(url, time.perf_counter() - start, response)
         response.ok = response.status_code in range(200, 400)
+        if cache_url and response.status_code == 200:
+            http_cache.put(cache_url, response)
         return response
 
 
@@ -114,6 +585,7 @@ def create_session(
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    GET responses are served from and stored in the HTTP cache if one is set
     :return: A session object
     """
     if is_tls:
@@ -151,22 +623,217 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+class ConversionCache:
+    """
+    Bounded LRU of converted descriptions, keyed by a hash of the raw HTML, the
+    target format and the converter backend, so that a posting scraped again
+    (from another site or search) is not converted twice. With a store (a
+    jobspy.cache.DescriptionStore) the conversions are also kept on disk across
+    runs. Used by the converters of every scraper once installed with
+    set_conversion_cache
+    """
+
+    def __init__(self, maxsize: int = 2048, store: DescriptionStore | None = None):
+        self.maxsize = maxsize
+        self.store = store
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(description_html: str, description_format: DescriptionFormat) -> str:
+        digest = hashlib.blake2b(description_html.encode(), digest_size=16)
+        return f"{description_format.value}:{converter_backend}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> str | None:
+        with self.lock:
+            text = self.entries.get(key)
+            if text is not None:
+                self.entries.move_to_end(key)
+        if text is None and self.store is not None:
+            text = self.store.get(key)
+            if text is not None:
+                self._remember(key, text)
+        with self.lock:
+            if text is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        record_conversion(cached=text is not None)
+        return text
+
+    def put(self, key: str, text: str):
+        self._remember(key, text)
+        if self.store is not None:
+            self.store.put(key, text)
+
+    def _remember(self, key: str, text: str):
+        with self.lock:
+            self.entries[key] = text
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def convert(
+        self,
+        description_html: str,
+        description_format: DescriptionFormat,
+        converter: Callable[[str], str],
+    ) -> str:
+        key = self.key(description_html, description_format)
+        text = self.get(key)
+        if text is None:
+            text = converter(description_html)
+            self.put(key, text)
+        return text
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+
+# ConversionCache of the descriptions converted by every scraper, see
+# set_conversion_cache
+conversion_cache = None
+
+
+def set_conversion_cache(cache: ConversionCache | None):
+    """
+    Caches converted descriptions in cache, e.g. ConversionCache(store=
+    DescriptionStore()) to keep them on disk, or stops caching with None
+    """
+    global conversion_cache
+    conversion_cache = cache
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
+    converter = converter_backends[converter_backend][DescriptionFormat.MARKDOWN]
+    if conversion_cache is None:
+        return converter(description_html)
+    return conversion_cache.convert(
+        description_html, DescriptionFormat.MARKDOWN, converter
+    )
+
+
+def _to_markdown(description_html: str) -> str:
+    with timed("convert"):
+        markdown = md(description_html)
     return markdown.strip()
 
+
 def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
-    text = re.sub(r'\s+',' ',text)
+    converter = converter_backends[converter_backend][DescriptionFormat.PLAIN]
+    if conversion_cache is None:
+        return converter(decription_html)
+    return conversion_cache.convert(decription_html, DescriptionFormat.PLAIN, converter)
+
+
+def _to_plain(description_html: str) -> str:
+    from bs4 import BeautifulSoup
+
+    with timed("convert"):
+        soup = BeautifulSoup(description_html, "html.parser")
+        text = soup.get_text(separator=" ")
+        text = re.sub(r"\s+", " ", text)
     return text.strip()
 
 
+def _to_markdown_lxml(description_html: str) -> str:
+    from jobspy.converters import to_markdown
+
+    with timed("convert"):
+        return to_markdown(description_html)
+
+
+def _to_plain_lxml(description_html: str) -> str:
+    from jobspy.converters import to_plain
+
+    with timed("convert"):
+        return to_plain(description_html)
+
+
+# converters of each backend by description format. Module-level functions so
+# that convert_descriptions can hand them to its worker processes
+converter_backends: dict[str, dict[DescriptionFormat, Callable[[str], str]]] = {
+    "markdownify": {
+        DescriptionFormat.MARKDOWN: _to_markdown,
+        DescriptionFormat.PLAIN: _to_plain,
+    },
+    "lxml": {
+        DescriptionFormat.MARKDOWN: _to_markdown_lxml,
+        DescriptionFormat.PLAIN: _to_plain_lxml,
+    },
+}
+# backend of markdown_converter, plain_converter and convert_descriptions, see
+# set_converter_backend
+converter_backend = "markdownify"
+
+
+def set_converter_backend(backend: str):
+    """
+    Converts descriptions with backend: "markdownify" (markdownify and
+    BeautifulSoup, the default) or "lxml" (jobspy.converters, same output from
+    an lxml tree walk, requires lxml)
+    """
+    global converter_backend
+    if backend not in converter_backends:
+        raise ValueError(
+            f"Invalid converter backend: {backend}, "
+            f"expected one of {', '.join(converter_backends)}"
+        )
+    if backend == "lxml":
+        import jobspy.converters  # noqa: F401, raises the install hint now
+    converter_backend = backend
+
+
+def convert_descriptions(
+    descriptions: list[str | None],
+    description_format: DescriptionFormat,
+    workers: int,
+) -> list[str | None]:
+    """
+    Converts HTML descriptions to description_format in a pool of worker
+    processes, handing each worker a batch of descriptions at a time. Repeated
+    descriptions and the ones in the conversion_cache are converted only once
+    """
+    if description_format == DescriptionFormat.HTML or not descriptions:
+        return list(descriptions)
+    converter = converter_backends[converter_backend][description_format]
+    converted = {}
+    for description_html in descriptions:
+        if description_html is None or description_html in converted:
+            continue
+        converted[description_html] = (
+            conversion_cache.get(
+                conversion_cache.key(description_html, description_format)
+            )
+            if conversion_cache is not None
+            else None
+        )
+    pending = [html for html, text in converted.items() if text is None]
+    if pending:
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            texts = executor.map(converter, pending, chunksize=chunksize)
+            for description_html, text in zip(pending, texts):
+                converted[description_html] = text
+                if conversion_cache is not None:
+                    conversion_cache.put(
+                        conversion_cache.key(description_html, description_format),
+                        text,
+                    )
+    return [
+        converted[description_html] if description_html is not None else None
+        for description_html in descriptions
+    ]
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
@@ -174,15 +841,22 @@ def extract_emails_from_text(text: str) -> list[str] | None:
     return email_regex.findall(text)
 
 
+# JobType of each of the values in its tuple. A few values belong to two job
+# types: get_enum_from_job_type takes the last of them, get_enum_from_value the
+# first
+job_type_by_value: dict[str, JobType] = {
+    value: job_type for job_type in JobType for value in job_type.value
+}
+first_job_type_by_value: dict[str, JobType] = {
+    value: job_type for job_type in reversed(JobType) for value in job_type.value
+}
+
+
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
     """
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
+    return job_type_by_value.get(job_type_str)
 
 
 def currency_parser(cur_str):
@@ -208,6 +882,20 @@ def remove_attributes(tag):
     return tag
 
 
+# salary range like "$50,000 - $60,000" or "$25-30/hr", groups are the min and
+# max amounts each followed by an optional k suffix
+salary_pattern = re.compile(
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+)
+# salary_pattern in the RE2 syntax of pyarrow, with \d and \s spelled out to
+# match the same unicode digits and whitespace as Python's re
+salary_pattern_re2 = (
+    r"\$(?P<min>\p{Nd}+(?:,\p{Nd}+)?(?:\.\p{Nd}+)?)(?P<min_k>[kK]?)"
+    r"[\s\x{0B}\x{1C}-\x{1F}\x{85}\p{Z}]*[-—–][\s\x{0B}\x{1C}-\x{1F}\x{85}\p{Z}]*"
+    r"(?:\$)?(?P<max>\p{Nd}+(?:,\p{Nd}+)?(?:\.\p{Nd}+)?)(?P<max_k>[kK]?)"
+)
+
+
 def extract_salary(
     salary_str,
     lower_limit=1000,
@@ -224,7 +912,6 @@ def extract_salary(
         return None, None, None, None
 
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -235,7 +922,7 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
+    match = salary_pattern.search(salary_str)
 
     if match:
         min_salary = to_int(match.group(1))
@@ -278,23 +965,193 @@ def extract_salary(
     return None, None, None, None
 
 
-def extract_job_type(description: str):
-    if not description:
-        return []
+def extract_salaries(
+    descriptions,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    extract_salary over a whole column of descriptions at once: a pandas Series,
+    a pyarrow Array / ChunkedArray or a list. With pyarrow installed the pattern
+    runs over the column in Arrow (RE2), otherwise it is matched in one loop; the
+    thresholds and annualization are applied with NumPy
+    :return: DataFrame of interval, min_amount, max_amount and currency columns,
+    aligned with descriptions, None / NaN where no salary was found
+    """
+    index = descriptions.index if isinstance(descriptions, pd.Series) else None
+    min_salary, max_salary, thousands = _salary_amounts(descriptions)
+    matched = ~np.isnan(min_salary)
+    min_salary = np.trunc(min_salary)
+    max_salary = np.trunc(max_salary)
+    # a k on either amount applies to both
+    min_salary[thousands] *= 1000
+    max_salary[thousands] *= 1000
+
+    hourly = min_salary < hourly_threshold
+    monthly = ~hourly & (min_salary < monthly_threshold)
+    factor = np.select([hourly, monthly], [2080.0, 12.0], 1.0)
+    max_threshold = np.select(
+        [hourly, monthly], [hourly_threshold, monthly_threshold], np.inf
+    )
+    annual_min = min_salary * factor
+    annual_max = np.where(max_salary < max_threshold, max_salary * factor, np.nan)
+    with np.errstate(invalid="ignore"):
+        valid = (
+            matched
+            & (annual_max != 0)
+            & (lower_limit <= annual_min)
+            & (annual_min <= upper_limit)
+            & (lower_limit <= annual_max)
+            & (annual_max <= upper_limit)
+            & (annual_min < annual_max)
+        )
+    interval = np.select(
+        [hourly, monthly],
+        [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+        CompensationInterval.YEARLY.value,
+    ).astype(object)
+    interval[~valid] = None
+    if enforce_annual_salary:
+        min_salary, max_salary = annual_min, annual_max
+    return pd.DataFrame(
+        {
+            "interval": interval,
+            "min_amount": np.where(valid, min_salary, np.nan),
+            "max_amount": np.where(valid, max_salary, np.nan),
+            "currency": np.where(valid, "USD", None),
+        },
+        index=index,
+    )
+
+
+def _salary_amounts(descriptions) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    :return: min and max amounts matched by salary_pattern in each description
+    (NaN where it does not match), and whether either has a k suffix
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return _salary_amounts_python(descriptions)
+    if not isinstance(descriptions, (pa.Array, pa.ChunkedArray)):
+        # from_pandas reads NaN, as pandas leaves for missing descriptions, as null
+        descriptions = pa.array(descriptions, type=pa.large_string(), from_pandas=True)
+    groups = pc.extract_regex(descriptions, salary_pattern_re2)
+
+    def amount(name: str) -> np.ndarray:
+        values = pc.replace_substring(pc.struct_field(groups, name), ",", "")
+        try:
+            numbers = pc.cast(values, pa.float64())
+        except pa.ArrowInvalid:
+            # digits of other scripts, which float() reads but Arrow does not
+            numbers = pa.array(
+                [float(value) if value else None for value in values.to_pylist()],
+                pa.float64(),
+            )
+        return np.asarray(pc.fill_null(numbers, np.nan), dtype=float)
+
+    thousands = pc.or_(
+        pc.not_equal(pc.struct_field(groups, "min_k"), ""),
+        pc.not_equal(pc.struct_field(groups, "max_k"), ""),
+    )
+    return (
+        amount("min"),
+        amount("max"),
+        np.asarray(pc.fill_null(thousands, False), dtype=bool),
+    )
+
+
+def _salary_amounts_python(descriptions) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    matches = [
+        salary_pattern.search(text) if isinstance(text, str) else None
+        for text in descriptions
+    ]
+    min_salary = np.full(len(matches), np.nan)
+    max_salary = np.full(len(matches), np.nan)
+    thousands = np.zeros(len(matches), bool)
+    for i, match in enumerate(matches):
+        if match:
+            min_salary[i] = float(match.group(1).replace(",", ""))
+            max_salary[i] = float(match.group(3).replace(",", ""))
+            thousands[i] = bool(match.group(2) or match.group(4))
+    return min_salary, max_salary, thousands
+
+
+class KeywordClassifier:
+    """
+    Finds which labels a text mentions a keyword of, case-insensitively. Keywords
+    are lowercase literals, or (literal, pattern) pairs for keywords with
+    variants (e.g. ("full", r"full\s?time")) whose pattern only runs when the
+    literal is found. The text is lowercased once and searched with substring
+    searches, which in CPython is several times faster than one regex
+    alternation of all the keywords
+    """
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
+    def __init__(self, keywords: dict[object, list[str | tuple[str, str]]]):
+        self.keywords = {
+            label: [
+                (keyword, None)
+                if isinstance(keyword, str)
+                else (keyword[0], re.compile(keyword[1]))
+                for keyword in label_keywords
+            ]
+            for label, label_keywords in keywords.items()
+        }
+
+    def find(self, *texts: str | None) -> list:
+        """
+        :return: labels mentioned in texts, in the order of the keywords
+        """
+        text = " ".join(text for text in texts if text).lower()
+        if not text:
+            return []
+        return [
+            label
+            for label, keywords in self.keywords.items()
+            if any(
+                literal in text and (pattern is None or pattern.search(text))
+                for literal, pattern in keywords
+            )
+        ]
+
+
+remote_keywords = ["remote", "work from home", "wfh"]
+job_type_keywords = {
+    JobType.FULL_TIME: [("full", r"full\s?time")],
+    JobType.PART_TIME: [("part", r"part\s?time")],
+    JobType.INTERNSHIP: ["internship"],
+    JobType.CONTRACT: ["contract"],
+}
+remote_classifier = KeywordClassifier({"remote": remote_keywords})
+job_classifier = KeywordClassifier({"remote": remote_keywords, **job_type_keywords})
+
+
+def is_remote_text(*texts: str | None) -> bool:
+    """
+    :return: whether any of texts mentions remote work
+    """
+    return bool(remote_classifier.find(*texts))
+
+
+def classify_job_text(*texts: str | None) -> tuple[bool, list[JobType] | None]:
+    """
+    Detects remote work and job types in one lowercasing of texts
+    :return: whether texts mention remote work, and the job types they mention
+    (None if none)
+    """
+    labels = job_classifier.find(*texts)
+    job_types = [label for label in labels if label != "remote"]
+    return "remote" in labels, job_types or None
 
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
 
-    return listing_types if listing_types else None
+def extract_job_type(description: str):
+    if not description:
+        return []
+    return classify_job_text(description)[1]
 
 
 def map_str_to_site(site_name: str) -> Site:
@@ -302,10 +1159,10 @@ def map_str_to_site(site_name: str) -> Site:
 
 
 def get_enum_from_value(value_str):
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
-    raise Exception(f"Invalid job type: {value_str}")
+    job_type = first_job_type_by_value.get(value_str)
+    if job_type is None:
+        raise Exception(f"Invalid job type: {value_str}")
+    return job_type
 
 
 def convert_to_annual(job_data: dict):
@@ -361,3 +1218,39 @@ desired_order = [
     "vacancy_count",
     "work_from_home_type",
 ]
+
+
+class JobFrameBuilder:
+    """
+    Accumulates normalized job rows into one buffer per column of desired_order
+    and builds the final DataFrame in a single pass
+    """
+
+    def __init__(self, columns: list[str] | None = None):
+        self.columns = list(columns or desired_order)
+        self.buffers: dict[str, list] = {column: [] for column in self.columns}
+        self.row_count = 0
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def append(self, row: dict):
+        for column, buffer in self.buffers.items():
+            buffer.append(row.get(column))
+        self.row_count += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def build(self) -> pd.DataFrame:
+        """
+        Builds the DataFrame sorted by site and date posted (newest first)
+        :return: Pandas DataFrame with columns in desired_order, empty if no rows
+        """
+        if not self.row_count:
+            return pd.DataFrame()
+        jobs_df = pd.DataFrame(self.buffers, columns=self.columns)
+        return jobs_df.sort_values(
+            by=["site", "date_posted"], ascending=[True, False]
+        ).reset_index(drop=True)
@@ -3,12 +3,14 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime
+from typing import Iterator
 
 from bs4 import BeautifulSoup
 
+from jobspy.exception import DeadlineExceeded
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
@@ -16,6 +18,7 @@ from jobspy.util import (
     markdown_converter,
     remove_attributes,
     create_logger,
+    rate_limiter,
 )
 from jobspy.model import (
     JobPost,
@@ -27,6 +30,7 @@ from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
+    Pause,
 )
 from jobspy.ziprecruiter.util import get_job_type_enum, add_params
 
@@ -50,7 +54,6 @@ class ZipRecruiter(Scraper):
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
@@ -60,27 +63,36 @@ class ZipRecruiter(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        return JobResponse(jobs=list(self.scrape_iter(scraper_input)))
+
+    def paginate(self, scraper_input: ScraperInput) -> Iterator[JobPost | Pause]:
+        """
+        Yields ZipRecruiter jobs with scraper_input criteria as each page is parsed.
+        :param scraper_input: Information about job search criteria.
+        :return: iterator of jobs
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        self.seen_urls = set()
+        job_count = 0
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if job_count >= scraper_input.results_wanted:
                 break
             if page > 1:
-                time.sleep(self.delay)
+                yield rate_limiter.pause(f"{self.api_url}/jobs-app/jobs")
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
+            if not jobs_on_page:
                 break
+            jobs_on_page = jobs_on_page[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs_on_page)
+            yield from jobs_on_page
             if not continue_token:
                 break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
@@ -104,19 +116,26 @@ class ZipRecruiter(Scraper):
                     err = f"ZipRecruiter response status code {res.status_code}"
                     err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
                 log.error(err)
+                self.failed = True
                 return jobs_list, ""
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             if "Proxy responded with" in str(e):
                 log.error(f"Indeed: Bad proxy")
             else:
                 log.error(f"Indeed: {str(e)}")
+            self.failed = True
             return jobs_list, ""
 
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+            job_results = [
+                executor.submit(copy_context().run, self._process_job, job)
+                for job in jobs_list
+            ]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
@@ -154,7 +173,11 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        if self.is_duplicate(title, company, location):
+            return None
+        description_full = job_url_direct = None
+        if not self.scraper_input.defer_descriptions and not self.is_known(job_url):
+            description_full, job_url_direct = self._get_descr(job_url)
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',
@@ -176,6 +199,10 @@ class ZipRecruiter(Scraper):
             listing_type=listing_type,
         )
 
+    def fetch_details(self, job_id: str, job_url: str) -> dict:
+        description_full, job_url_direct = self._get_descr(job_url)
+        return {"description": description_full, "job_url_direct": job_url_direct}
+
     def _get_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None